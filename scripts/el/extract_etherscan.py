@@ -1,18 +1,32 @@
-import json, argparse, logging, os
+from __future__ import annotations
+
+import json, argparse, atexit, logging, math, queue, re, shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 import logging.handlers
 
 from pathlib import Path
-from re import A
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
-import polars as pl
-import pandas as pd
-from onchaindata.data_extraction.etherscan import etherscan_to_parquet, EtherscanClient
+
+# polars, pyarrow and onchaindata are imported where used, so that --help and
+# argument errors don't pay for loading them
+if TYPE_CHECKING:
+    from onchaindata.data_extraction.etherscan import EtherscanClient
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Multipliers for the K/M/B suffixes accepted by parse_number_with_suffix
+NUMBER_SUFFIXES = {
+    "": 1,
+    "K": 1_000,
+    "M": 1_000_000,
+    "B": 1_000_000_000,
+}
+NUMBER_WITH_SUFFIX_RE = re.compile(r"^(\d+(?:\.\d+)?)([KMB]?)$")
+
 
 def parse_number_with_suffix(value: str) -> int:
     """Parse numbers with K/M/B suffixes (e.g., '18.5M' -> 18500000).
@@ -23,31 +37,32 @@ def parse_number_with_suffix(value: str) -> int:
     Returns:
         Integer value
 
+    Raises:
+        ValueError: If value is not a number with an optional K/M/B suffix
+
     Examples:
         '18.5M' -> 18500000
         '1.2K' -> 1200
         '3B' -> 3000000000
         '1000' -> 1000
     """
-    value = str(value).strip().upper()
+    match = NUMBER_WITH_SUFFIX_RE.match(str(value).strip().upper())
+    if match is None:
+        raise ValueError(f"Invalid number: {value!r} (expected e.g. 1000, 1.2K, 18.5M)")
 
-    suffixes = {
-        "K": 1_000,
-        "M": 1_000_000,
-        "B": 1_000_000_000,
-    }
-
-    for suffix, multiplier in suffixes.items():
-        if value.endswith(suffix):
-            number_part = value[:-1]
-            return int(float(number_part) * multiplier)
-
-    # No suffix, parse as regular int
-    return int(value)
+    number, suffix = match.groups()
+    if suffix == "" and "." not in number:
+        # Plain integers skip the float round-trip, which loses precision
+        return int(number)
+    return int(float(number) * NUMBER_SUFFIXES[suffix])
 
 
 def setup_logging(log_filename: str = None, level: str = "INFO"):
-    """Sets up logging with console streaming and optional file logging."""
+    """Sets up logging with console streaming and optional file logging.
+
+    Records are only enqueued by the logging thread; a background listener
+    formats them and does the console and file I/O.
+    """
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -58,17 +73,117 @@ def setup_logging(log_filename: str = None, level: str = "INFO"):
     # Console handler (always present)
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (optional)
-    if not Path("logging").exists():
-        Path("logging").mkdir(parents=True, exist_ok=True)
     if log_filename:
+        Path("logging").mkdir(parents=True, exist_ok=True)
         file_handler = logging.handlers.RotatingFileHandler(
             f"logging/{log_filename}", maxBytes=5 * 1024 * 1024, backupCount=5
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    # Drain remaining records on exit
+    atexit.register(listener.stop)
+
+
+def parquet_block_stats(file_path: Path) -> tuple[int, int, int]:
+    """Return (row count, min blockNumber, max blockNumber) of a parquet file.
+
+    Read from the footer's row-group statistics, so no data pages are decoded.
+    Falls back to a single scan of the column if any row group lacks them.
+
+    Args:
+        file_path: Path to the parquet file
+    """
+    import polars as pl
+    import pyarrow.parquet as pq
+
+    metadata = pq.ParquetFile(file_path).metadata
+    col_idx = metadata.schema.names.index("blockNumber")
+    stats = [
+        metadata.row_group(i).column(col_idx).statistics
+        for i in range(metadata.num_row_groups)
+    ]
+    if stats and all(s is not None and s.has_min_max for s in stats):
+        return (
+            metadata.num_rows,
+            min(s.min for s in stats),
+            max(s.max for s in stats),
+        )
+
+    return (
+        pl.scan_parquet(file_path)
+        .select(
+            pl.len(),
+            pl.col("blockNumber").min().alias("min_block"),
+            pl.col("blockNumber").max().alias("max_block"),
+        )
+        .collect()
+        .row(0)
+    )
+
+
+def split_block_range(
+    from_block: int, to_block: int, n_windows: int, block_chunk_size: int
+) -> list[tuple[int, int]]:
+    """Split [from_block, to_block] into up to `n_windows` contiguous windows.
+
+    Windows are whole multiples of `block_chunk_size` and span at least two
+    chunks, so each worker has more than one request to make. A range of at
+    most two chunks, down to a single block, yields one window.
+    """
+    if to_block < from_block:
+        raise ValueError(
+            f"to_block ({to_block}) must not be lower than from_block ({from_block})"
+        )
+    if to_block == from_block:
+        return [(from_block, to_block)]
+
+    n_chunks = math.ceil((to_block - from_block) / block_chunk_size)
+    n_windows = max(1, min(n_windows, n_chunks // 2))
+    window_size = math.ceil(n_chunks / n_windows) * block_chunk_size
+
+    windows = []
+    for window_start in range(from_block, to_block, window_size):
+        windows.append((window_start, min(window_start + window_size, to_block)))
+    # Fold a short tail into the previous window
+    if len(windows) > 1 and windows[-1][1] - windows[-1][0] <= block_chunk_size:
+        windows[-2:] = [(windows[-2][0], windows[-1][1])]
+    return windows
+
+
+def merge_shards(shard_paths: list[Path], output_path: Path, table: str):
+    """Stitch shard files (and any existing output) into `output_path`.
+
+    Adjacent windows share their boundary block, so rows are deduplicated on
+    the table's primary key. Shards are removed afterwards.
+    """
+    import polars as pl
+    from onchaindata.data_extraction.etherscan import (
+        PARQUET_WRITE_OPTIONS,
+        PRIMARY_KEYS,
+    )
+
+    sources = [p for p in [output_path, *shard_paths] if p.exists()]
+    if not sources:
+        return
+
+    lf = pl.concat([pl.scan_parquet(p) for p in sources], how="diagonal_relaxed")
+    if table in PRIMARY_KEYS:
+        lf = lf.unique(subset=PRIMARY_KEYS[table], keep="first")
+
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+    # Same layout as the shards, so parquet_block_stats can use the footer
+    lf.sink_parquet(tmp_path, **PARQUET_WRITE_OPTIONS)
+    tmp_path.replace(output_path)
+    for shard_path in shard_paths:
+        shard_path.unlink(missing_ok=True)
 
 
 def extract_with_retry(
@@ -80,9 +195,14 @@ def extract_with_retry(
     to_block: int,
     output_dir: Path,
     max_retries: int = 3,
+    block_chunk_size: int = 5_000,
+    max_workers: int = 4,
 ):
     """Extract logs or transactions with automatic retry on failures.
 
+    The block range is split into up to `max_workers` windows fetched
+    concurrently; the client's rate limit is shared by all of them.
+
     Args:
         address: The contract address to extract data from
         etherscan_client: Initialized EtherscanClient instance
@@ -92,19 +212,51 @@ def extract_with_retry(
         to_block: Ending block number
         output_dir: Directory to save output parquet files
         max_retries: Maximum number of retry attempts for failed blocks
+        block_chunk_size: Number of blocks per Etherscan request
+        max_workers: Maximum number of block windows fetched concurrently
+
+    Returns:
+        (row count, min block, max block) of the output parquet file
     """
+    from onchaindata.data_extraction.etherscan import etherscan_to_parquet
+
     output_path = (
         output_dir / f"{chain}_{address}_{table}_{from_block}_{to_block}.parquet"
     )
-    etherscan_to_parquet(
-        address=address,
-        etherscan_client=etherscan_client,
-        table=table,
-        from_block=from_block,
-        to_block=to_block,
-        output_path=output_path,
-        block_chunk_size=5_000,
-    )
+    windows = split_block_range(from_block, to_block, max_workers, block_chunk_size)
+    if len(windows) == 1:
+        etherscan_to_parquet(
+            address=address,
+            etherscan_client=etherscan_client,
+            table=table,
+            from_block=from_block,
+            to_block=to_block,
+            output_path=output_path,
+            block_chunk_size=block_chunk_size,
+        )
+    else:
+        # Fetch contiguous windows concurrently, each into its own shard
+        shard_paths = [
+            output_path.with_name(f"{output_path.stem}_shard_{i}.parquet")
+            for i in range(len(windows))
+        ]
+        with ThreadPoolExecutor(max_workers=len(windows)) as executor:
+            futures = [
+                executor.submit(
+                    etherscan_to_parquet,
+                    address=address,
+                    etherscan_client=etherscan_client,
+                    table=table,
+                    from_block=window_start,
+                    to_block=window_end,
+                    output_path=shard_path,
+                    block_chunk_size=block_chunk_size,
+                )
+                for (window_start, window_end), shard_path in zip(windows, shard_paths)
+            ]
+            for future in futures:
+                future.result()
+        merge_shards(shard_paths, output_path, table)
 
     # Retry failed blocks if error file exists
     error_file = Path(f"logging/extract_error/{chain}_{address}_{table}.csv")
@@ -115,78 +267,85 @@ def extract_with_retry(
             error_file=error_file,
             table=table,
             output_path=output_path,
+            etherscan_client=etherscan_client,
         )
         retries += 1
-    n = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-    min_block = (
-        pl.scan_parquet(output_path)
-        .select(pl.col("blockNumber").min())
-        .collect()
-        .item()
-    )
-    max_block = (
-        pl.scan_parquet(output_path)
-        .select(pl.col("blockNumber").max())
-        .collect()
-        .item()
-    )
+    n, min_block, max_block = parquet_block_stats(output_path)
     logger.info(f"{chain} - {address} - {table} - {min_block}-{max_block}, {n} ✅")
+    return n, min_block, max_block
+
+
+def retry_failed_blocks(
+    error_file: Path,
+    table: str,
+    output_path: Path,
+    etherscan_client: EtherscanClient,
+    max_workers: int = 8,
+):
+    """Retry failed block ranges with smaller chunk size, several ranges at a time.
 
+    Rows for the caller's chain reuse `etherscan_client`, so retries share its
+    rate limit with every other extraction running against the same API key.
+    """
 
-def retry_failed_blocks(error_file: Path, table: str, output_path: Path):
-    """Retry failed block ranges with smaller chunk size."""
+    import polars as pl
+    from onchaindata.data_extraction.etherscan import (
+        etherscan_to_parquet,
+        EtherscanClient,
+    )
 
-    df = pd.read_csv(error_file)
+    df = pl.read_csv(error_file)
 
     # Create resolved directory if it doesn't exist
     resolved_dir = error_file.parent / "resolved"
     resolved_dir.mkdir(parents=True, exist_ok=True)
     # Generate resolved filename by adding timestamp
     resolved_file_path = resolved_dir / f"{error_file.stem}_resolved.csv"
-    # Save resolved error file, appending if file exists
-    df.to_csv(
-        resolved_file_path,
-        mode="a",
-        header=not resolved_file_path.exists(),
-        index=False,
-    )
-    os.remove(error_file)
-
-    for _, row in df.iterrows():
-        chain = row.chain
-        etherscan_client = EtherscanClient(chain=chain)
-        address = row.address
-
-        from_block = row.from_block
-        to_block = row.to_block
-        block_chunk_size = int(row.block_chunk_size / 10)
-
+    # Move the error file to the resolved file: a rename when it is the first,
+    # otherwise append its rows as-is (without the header line)
+    if not resolved_file_path.exists():
+        error_file.rename(resolved_file_path)
+    else:
+        with open(error_file, "rb") as src, open(resolved_file_path, "ab") as dst:
+            src.readline()
+            shutil.copyfileobj(src, dst)
+        error_file.unlink()
+
+    # One client per chain, shared by the workers; its session is rate limited
+    clients = {etherscan_client.chain: etherscan_client}
+    for chain in df["chain"].unique():
+        if chain not in clients:
+            clients[chain] = EtherscanClient(chain=chain)
+
+    def retry_row(row: dict):
         etherscan_to_parquet(
-            address=address,
-            etherscan_client=etherscan_client,
-            from_block=from_block,
-            to_block=to_block,
-            block_chunk_size=block_chunk_size,
+            address=row["address"],
+            etherscan_client=clients[row["chain"]],
+            from_block=row["from_block"],
+            to_block=row["to_block"],
+            block_chunk_size=int(row["block_chunk_size"] / 10),
             table=table,
             output_path=output_path,
         )
 
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(retry_row, row) for row in df.iter_rows(named=True)]
+        for future in futures:
+            future.result()
+
 
-def rename_parquet_file(file_path: Path, **kwargs):
+def rename_parquet_file(
+    file_path: Path, min_block: int = None, max_block: int = None, **kwargs
+):
     """
     To rename the parquet file to the actual blocks range of the data
     Args:
         file_path: Path to the parquet file
+        min_block: Minimum block number in the file, read from it if not given
+        max_block: Maximum block number in the file, read from it if not given
     """
-    min_block = (
-        pl.scan_parquet(file_path).select(pl.col("blockNumber").min()).collect().item()
-    )
-    max_block = (
-        pl.scan_parquet(file_path).select(pl.col("blockNumber").max()).collect().item()
-    )
-    new_file_path = file_path.with_name(
-        f"{file_path.stem}_{min_block}_{max_block}.parquet"
-    )
+    if min_block is None or max_block is None:
+        _, min_block, max_block = parquet_block_stats(file_path)
     new_file_path = (
         file_path.parent
         / f"{kwargs['chain']}_{kwargs['address'].lower()}_{kwargs['table']}_{min_block}_{max_block}.parquet"
@@ -267,6 +426,8 @@ def main():
         logging_level = "INFO"
     setup_logging(log_filename="extraction.log", level=logging_level)
 
+    from onchaindata.data_extraction.etherscan import EtherscanClient
+
     etherscan_client = EtherscanClient(chain=args.chain)
 
     if args.last_n_days:
@@ -283,41 +444,45 @@ def main():
         )
         to_block = args.to_block or etherscan_client.get_latest_block()
 
-    if args.logs:
-        extract_with_retry(
-            address=args.address.lower(),
-            etherscan_client=etherscan_client,
-            chain=args.chain,
-            table="logs",
-            from_block=from_block,
-            to_block=to_block,
-            output_dir=output_dir,
-        )
-        file_path = (
-            output_dir
-            / f"{args.chain}_{args.address.lower()}_logs_{from_block}_{to_block}.parquet"
-        )
-        rename_parquet_file(
-            file_path, chain=args.chain, address=args.address, table="logs"
+    tables = [
+        table
+        for table, requested in (
+            ("logs", args.logs),
+            ("transactions", args.transactions),
         )
-    if args.transactions:
-        extract_with_retry(
+        if requested
+    ]
+
+    def extract_table(table: str):
+        # The client is shared so both tables stay within one API rate limit
+        _, min_block, max_block = extract_with_retry(
             address=args.address.lower(),
             etherscan_client=etherscan_client,
             chain=args.chain,
-            table="transactions",
+            table=table,
             from_block=from_block,
             to_block=to_block,
             output_dir=output_dir,
         )
         file_path = (
             output_dir
-            / f"{args.chain}_{args.address.lower()}_transactions_{from_block}_{to_block}.parquet"
+            / f"{args.chain}_{args.address.lower()}_{table}_{from_block}_{to_block}.parquet"
         )
         rename_parquet_file(
-            file_path, chain=args.chain, address=args.address, table="transactions"
+            file_path,
+            min_block=min_block,
+            max_block=max_block,
+            chain=args.chain,
+            address=args.address,
+            table=table,
         )
 
+    # Logs and transactions are independent network-bound fetches; overlap them
+    with ThreadPoolExecutor(max_workers=max(len(tables), 1)) as executor:
+        futures = [executor.submit(extract_table, table) for table in tables]
+        for future in futures:
+            future.result()
+
 
 if __name__ == "__main__":
     main()
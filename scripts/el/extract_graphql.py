@@ -1,26 +1,28 @@
 #!/usr/bin/env python3
 """
-GraphQL data fetcher with streaming and batch modes.
+GraphQL data fetcher, batch mode.
 
-This script fetches data from a GraphQL endpoint and either:
-1. Saves to Parquet file (batch mode)
-2. Pushes directly to database (streaming mode)
+This script fetches data from a GraphQL endpoint once and saves it to a
+Parquet file. Streaming to the database is stream_graphql.py.
 """
 
-import argparse, json, logging
+import argparse, logging, re
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 load_dotenv()
-from onchaindata.data_pipeline import Loader
-from onchaindata.utils import PostgresClient, SnowflakeClient
-
-from onchaindata.data_extraction import GraphQLBatch, GraphQLStream
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _block_filter_re(table_name: str) -> re.Pattern:
+    """Compiled pattern matching the argument list of `table_name(...)` in a query."""
+    return re.compile(rf"{re.escape(table_name)}\s*\((.*?)\)")
+
+
 def _add_block_filters_to_query(
     query: str, table_name: str, from_block: int = None, to_block: int = None
 ) -> str:
@@ -36,8 +38,6 @@ def _add_block_filters_to_query(
     Returns:
         Modified query string with block filters
     """
-    import re
-
     # Build where clause - combine conditions in a single blockNumber object
     block_conditions = []
     if from_block is not None:
@@ -51,10 +51,6 @@ def _add_block_filters_to_query(
     # Create proper GraphQL where clause with conditions in single blockNumber object
     where_clause = f"blockNumber: {{{', '.join(block_conditions)}}}"
 
-    # Find the table call in the query and add/modify where clause
-    # Pattern: tableName(...) or tableName(order_by: {...})
-    pattern = rf"{table_name}\s*\((.*?)\)"
-
     def replacer(match):
         existing_args = match.group(1).strip()
         # Check if there's already a where clause
@@ -69,7 +65,9 @@ def _add_block_filters_to_query(
             # No existing args, add where clause
             return f"{table_name}(where: {{{where_clause}}})"
 
-    modified_query = re.sub(pattern, replacer, query, count=1)
+    # Find the table call in the query and add/modify where clause
+    # Pattern: tableName(...) or tableName(order_by: {...})
+    modified_query = _block_filter_re(table_name).sub(replacer, query, count=1)
     return modified_query
 
 
@@ -80,6 +78,9 @@ def extract(args):
     Args:
         args: Parsed command-line arguments
     """
+    import polars as pl
+    from onchaindata.data_extraction import GraphQLBatch
+
     # Load query
     if args.query_file:
         with open(args.query_file, "r") as f:
@@ -113,21 +114,31 @@ def extract(args):
     logger.info(f"Fetched {len(df)} records")
 
     # Save to Parquet
-    min_block_number = df["blockNumber"].min()
-    max_block_number = df["blockNumber"].max()
+    min_block_number, max_block_number = df.select(
+        pl.col("blockNumber").min().alias("min_block"),
+        pl.col("blockNumber").max().alias("max_block"),
+    ).row(0)
     output_path = (
         Path(args.output_dir)
         / f"{args.file_name}_{min_block_number}_{max_block_number}.parquet"
     )
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.write_parquet(output_path)
+    # Bounded row groups keep writer memory flat; statistics let readers
+    # take the block range from the footer
+    df.write_parquet(
+        output_path,
+        compression="zstd",
+        row_group_size=1_000_000,
+        statistics=True,
+        use_pyarrow=False,
+    )
 
     logger.info(f"Saved to: {output_path}")
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Fetch data from GraphQL endpoint with streaming or batch mode"
+        description="Fetch data from a GraphQL endpoint and save it to Parquet"
     )
 
     # GraphQL endpoint configuration
@@ -1,10 +1,7 @@
 import argparse
 from dotenv import load_dotenv
-import polars as pl
 
 load_dotenv()
-from onchaindata.data_pipeline import Loader
-from onchaindata.utils import SnowflakeClient, PostgresClient
 
 
 def main():
@@ -13,7 +10,7 @@ def main():
         "-f",
         "--file_path",
         type=str,
-        help="File path",
+        help="File path; for parquet, a glob pattern loads every matching file",
         required=True,
     )
     parser.add_argument(
@@ -54,6 +51,12 @@ def main():
     )
 
     args = parser.parse_args()
+
+    # Heavy imports only once the arguments are valid
+    import polars as pl
+    from onchaindata.data_pipeline import Loader
+    from onchaindata.utils import SnowflakeClient, PostgresClient
+
     if args.client == "snowflake":
         client = SnowflakeClient().from_env()
     elif args.client == "postgres":
@@ -65,27 +68,33 @@ def main():
 
     loader = Loader(client=client)
 
-    if args.file_path.endswith(".csv"):
-        df = pl.read_csv(args.file_path)
-    elif args.file_path.endswith(".parquet"):
-        df = pl.read_parquet(args.file_path)
-    else:
-        raise ValueError(
-            f"Invalid file extension: {args.file_path}, use 'csv' or 'parquet'"
-        )
-
     # Parse primary key if provided
     primary_key = None
     if args.primary_key:
         primary_key = [col.strip() for col in args.primary_key.split(",")]
 
-    loader.load_dataframe(
-        df=df,
-        schema=args.schema,
-        table_name=args.table,
-        write_disposition=args.write_disposition,
-        primary_key=primary_key,
-    )
+    if args.file_path.endswith(".parquet"):
+        # Streamed in record batches by the loader, never fully materialized
+        loader.load_parquet(
+            file_path=args.file_path,
+            schema=args.schema,
+            table_name=args.table,
+            write_disposition=args.write_disposition,
+            primary_key=primary_key,
+        )
+    elif args.file_path.endswith(".csv"):
+        df = pl.scan_csv(args.file_path).collect(engine="streaming")
+        loader.load_dataframe(
+            df=df,
+            schema=args.schema,
+            table_name=args.table,
+            write_disposition=args.write_disposition,
+            primary_key=primary_key,
+        )
+    else:
+        raise ValueError(
+            f"Invalid file extension: {args.file_path}, use 'csv' or 'parquet'"
+        )
 
 
 if __name__ == "__main__":
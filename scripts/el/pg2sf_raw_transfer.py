@@ -2,11 +2,14 @@
 
 """
 Move data from PostgreSQL (raw.raw_transfer) to Snowflake (raw.transfer).
-Queries data from PostgreSQL within a block range and loads to Snowflake.
+Streams data from PostgreSQL within a block range and loads it to Snowflake
+batch by batch.
 """
 
 import argparse
+import json
 import logging
+from typing import Any, Iterable, Iterator
 from dotenv import load_dotenv
 import polars as pl
 
@@ -31,68 +34,153 @@ def setup_logging(verbose: int = 0):
     return logging.getLogger(__name__)
 
 
-def query_postgres_data(
+# Expression index matching the block range predicate in query_postgres_data
+BLOCK_NUMBER_INDEX = """
+    CREATE INDEX IF NOT EXISTS raw_transfer_block_number_int_idx
+    ON raw.raw_transfer ((block_number::integer))
+"""
+
+
+def ensure_block_number_index(
+    pg_client: PostgresClient,
+    logger: logging.Logger,
+) -> None:
+    """
+    Create the block number expression index on raw.raw_transfer if missing.
+
+    Without it every transfer casts block_number row by row over a full scan.
+
+    Args:
+        pg_client: PostgresClient instance
+        logger: Logger instance
+    """
+    logger.info("Ensuring block number index on raw.raw_transfer")
+    with pg_client.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(BLOCK_NUMBER_INDEX)
+        conn.commit()
+
+
+# Polars dtypes for Postgres type OIDs. Columns of other types (e.g. numeric,
+# which can exceed Polars' 38-digit Decimal, or json) are read as text.
+PG_TYPE_DTYPES = {
+    16: pl.Boolean,  # bool
+    20: pl.Int64,  # int8
+    21: pl.Int16,  # int2
+    23: pl.Int32,  # int4
+    700: pl.Float32,  # float4
+    701: pl.Float64,  # float8
+    25: pl.String,  # text
+    1042: pl.String,  # bpchar
+    1043: pl.String,  # varchar
+    1082: pl.Date,  # date
+    1114: pl.Datetime("us"),  # timestamp
+    1184: pl.Datetime("us", "UTC"),  # timestamptz
+}
+
+
+def _as_text(value: Any) -> Any:
+    """Render a value of a type without a Polars mapping as text."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _rows_to_frame(rows: list, schema: list) -> pl.DataFrame:
+    """Build a DataFrame column by column from row tuples, with fixed dtypes."""
+    series = []
+    for (name, dtype), values in zip(schema, zip(*rows)):
+        if dtype is None:
+            values = [_as_text(value) for value in values]
+            dtype = pl.String
+        series.append(pl.Series(name, values, dtype=dtype))
+    return pl.DataFrame(series)
+
+
+def iter_postgres_batches(
     pg_client: PostgresClient,
     from_block: int,
     to_block: int,
     logger: logging.Logger,
-) -> pl.DataFrame:
+    batch_size: int = 200_000,
+) -> Iterator[pl.DataFrame]:
     """
-    Query data from PostgreSQL raw.raw_transfer table within block range.
+    Stream raw.raw_transfer rows within a block range as DataFrames.
+
+    Rows are read through a server-side cursor, `batch_size` at a time, so
+    only one batch is held in memory by the reader. Every batch has the same
+    schema, taken from the result's column types rather than inferred from the
+    values, so a column that is entirely NULL in one batch keeps its type.
 
     Args:
         pg_client: PostgresClient instance
         from_block: Starting block number (inclusive)
         to_block: Ending block number (inclusive)
         logger: Logger instance
+        batch_size: Rows per DataFrame
 
-    Returns:
-        Polars DataFrame with queried data
+    Yields:
+        Polars DataFrames with the queried rows
     """
-    query = f"""
+    # Block bounds are bound as parameters so the statement text stays constant
+    # and the server can reuse its prepared plan across runs. The predicate
+    # matches BLOCK_NUMBER_INDEX's expression so the planner can range-scan it.
+    # No ORDER BY: Snowflake does not need ordered input, and sorting a wide
+    # block range would spill to disk on the Postgres side.
+    query = """
         SELECT *
         FROM raw.raw_transfer
-        WHERE block_number::integer >= {from_block}
-          AND block_number::integer <= {to_block}
-        ORDER BY block_number
+        WHERE block_number::integer BETWEEN %s AND %s
     """
 
     logger.info(f"Querying PostgreSQL for blocks {from_block} to {to_block}")
     logger.debug(f"Query: {query}")
+    n_rows = 0
     with pg_client.get_connection() as conn:
-        df = pl.read_database(connection=conn, query=query)
-
-    logger.info(f"Retrieved {len(df)} rows from PostgreSQL")
-
-    return df
+        with conn.cursor(name="pg2sf_raw_transfer", binary=True) as cur:
+            cur.itersize = batch_size
+            cur.execute(query, (from_block, to_block))
+            schema = [
+                (column.name, PG_TYPE_DTYPES.get(column.type_code))
+                for column in cur.description
+            ]
+            while rows := cur.fetchmany(batch_size):
+                df = _rows_to_frame(rows, schema)
+                n_rows += len(df)
+                logger.info(f"Read {n_rows} rows from PostgreSQL")
+                yield df
 
 
 def load_to_snowflake(
-    df: pl.DataFrame,
+    batches: Iterable[pl.DataFrame],
     sf_loader: Loader,
     logger: logging.Logger,
 ) -> None:
     """
-    Load DataFrame to Snowflake raw.transfer table.
+    Load DataFrame batches to Snowflake raw.transfer table.
+
+    Batches are uploaded while the next ones are still being read.
 
     Args:
-        df: Polars DataFrame to load
+        batches: Polars DataFrames to load
         sf_loader: Loader instance configured with SnowflakeClient
         logger: Logger instance
     """
-    if len(df) == 0:
-        logger.warning("No data to load to Snowflake")
-        return
-
-    logger.info(f"Loading {len(df)} rows to Snowflake raw.transfer")
+    logger.info("Loading batches to Snowflake raw.transfer")
 
-    result = sf_loader.load_dataframe(
-        df=df,
+    result = sf_loader.load_dataframe_batches(
+        batches=batches,
         schema="raw",
         table_name="raw_transfer",
         write_disposition="append",
     )
 
+    if not result:
+        logger.warning("No data to load to Snowflake")
+        return
+
     logger.info(f"Successfully loaded data to Snowflake: {result}")
 
 
@@ -112,6 +200,11 @@ def main():
         required=True,
         help="Ending block number (inclusive)",
     )
+    parser.add_argument(
+        "--create_index",
+        action="store_true",
+        help="Create the block number index on raw.raw_transfer before querying",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -137,17 +230,18 @@ def main():
     sf_client = SnowflakeClient().from_env()
     sf_loader = Loader(client=sf_client)
 
-    # Step 2: Query data from PostgreSQL
-    df = query_postgres_data(
+    if args.create_index:
+        ensure_block_number_index(pg_client=pg_client, logger=logger)
+
+    # Step 2: Stream data from PostgreSQL into Snowflake, batch by batch
+    batches = iter_postgres_batches(
         pg_client=pg_client,
         from_block=args.from_block,
         to_block=args.to_block,
         logger=logger,
     )
-
-    # Step 3: Load data to Snowflake
     load_to_snowflake(
-        df=df,
+        batches=batches,
         sf_loader=sf_loader,
         logger=logger,
     )
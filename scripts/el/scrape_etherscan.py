@@ -12,7 +12,12 @@ Usage:
 
 import argparse
 import logging
+import queue
+import sqlite3
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 
 import pandas as pd
@@ -22,6 +27,9 @@ from onchaindata.data_extraction.etherscan import EtherscanClient
 
 logger = logging.getLogger(__name__)
 
+# Contract metadata looked up on earlier runs, one SQLite file per chain
+METADATA_CACHE_DIR = Path.home() / ".cache" / "etherscan"
+
 
 def setup_logging(verbose: bool = False):
     """Set up logging configuration."""
@@ -33,6 +41,146 @@ def setup_logging(verbose: bool = False):
     )
 
 
+class MetadataCache:
+    """SQLite store of contract metadata keyed by lowercase address."""
+
+    def __init__(self, path: Path, ttl_days: float = 30):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite file
+            ttl_days: Age after which an entry is fetched again
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.max_age = ttl_days * 86_400
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS contract_metadata (
+                address TEXT PRIMARY KEY,
+                contract_name TEXT,
+                creation_block INTEGER,
+                has_creation_block INTEGER NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+
+    def get_many(self, addresses: list, with_creation_block: bool = False) -> dict:
+        """Return address -> (contract_name, creation_block) for fresh entries."""
+        keys = list({address.lower() for address in addresses})
+        if not keys:
+            return {}
+        hits = {}
+        # Query in batches to stay under SQLite's bound parameter limit
+        for start in range(0, len(keys), 500):
+            batch = keys[start : start + 500]
+            rows = self.conn.execute(
+                f"""
+                SELECT address, contract_name, creation_block
+                FROM contract_metadata
+                WHERE address IN ({",".join("?" * len(batch))})
+                  AND fetched_at >= ?
+                  AND has_creation_block >= ?
+                """,
+                (*batch, time.time() - self.max_age, int(with_creation_block)),
+            )
+            hits.update((row[0], (row[1], row[2])) for row in rows)
+        return {
+            address: hits[address.lower()]
+            for address in addresses
+            if address.lower() in hits
+        }
+
+    def put_many(self, metadata: dict, with_creation_block: bool = False) -> None:
+        """Store successful lookups.
+
+        Exceptions are not cached, nor are missing creation blocks when they
+        were requested: the client returns None for lookup failures as well.
+        """
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO contract_metadata VALUES (?, ?, ?, ?, ?)",
+                [
+                    (address.lower(), *result, int(with_creation_block), now)
+                    for address, result in metadata.items()
+                    if not isinstance(result, Exception)
+                    and not (with_creation_block and result[1] is None)
+                ],
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def fetch_contract_metadata(
+    etherscan_client: EtherscanClient,
+    addresses: list,
+    with_creation_block: bool = False,
+    max_workers: int = 8,
+    cache: MetadataCache = None,
+) -> dict:
+    """
+    Fetch contract names (and creation blocks) from the Etherscan API concurrently.
+
+    The API calls are network-bound, so they overlap in a thread pool; the
+    client's rate limit is shared by the workers. Creation blocks are fetched
+    with the multi-address getcontractcreation endpoint, 5 addresses per call.
+    `main` runs this in the background while its browser pool scrapes name tags.
+
+    Args:
+        etherscan_client: Etherscan API client
+        addresses: Addresses to look up
+        with_creation_block: Also fetch the contract creation block number
+        max_workers: Number of concurrent API lookups
+        cache: Optional cache; hits skip the API and new lookups are stored
+
+    Returns:
+        Dict mapping each address to (contract_name, creation_block_number), or
+        to the exception raised while fetching it
+    """
+
+    metadata = cache.get_many(addresses, with_creation_block) if cache else {}
+    # Look up each remaining address once, however often it repeats
+    missing = list(dict.fromkeys(a for a in addresses if a not in metadata))
+    logger.info(f"Metadata cache hits: {len(metadata)}, to fetch: {len(missing)}")
+
+    def _fetch_name(address):
+        try:
+            return etherscan_client.get_contract_metadata(address)["ContractName"]
+        except Exception as e:
+            return e
+
+    # Creation blocks are looked up 5 addresses per request
+    creation_batches = (
+        [missing[i : i + 5] for i in range(0, len(missing), 5)]
+        if with_creation_block
+        else []
+    )
+    creation_blocks = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        names = executor.map(_fetch_name, missing)
+        for batch_blocks in executor.map(
+            etherscan_client.get_contract_creation_block_numbers, creation_batches
+        ):
+            creation_blocks.update(batch_blocks)
+        fetched = {
+            address: (
+                name
+                if isinstance(name, Exception)
+                else (name, creation_blocks.get(address))
+            )
+            for address, name in zip(missing, names)
+        }
+    if cache:
+        cache.put_many(fetched, with_creation_block)
+
+    metadata.update(fetched)
+    return metadata
+
+
 def extract_contract_name_tags(
     df: pd.DataFrame,
     etherscan_client: EtherscanClient,
@@ -52,8 +200,8 @@ def extract_contract_name_tags(
     Returns:
         DataFrame with added 'name_tag' column
     """
-    # Make a copy to avoid modifying the original
-    df = df.copy()
+    # The input frame is never mutated: results are collected in lists and
+    # returned on a new frame built with assign(), so no upfront copy is needed
 
     # Validate address column exists
     if address_column not in df.columns:
@@ -62,34 +210,45 @@ def extract_contract_name_tags(
         )
         raise ValueError(f"Column '{address_column}' not found")
 
-    # Initialize name_tag column if it doesn't exist
-    if "name_tag" not in df.columns:
-        df["name_tag"] = None
-
     total = len(df)
     logger.info(f"Scraping {total} addresses from Etherscan")
 
+    metadata = fetch_contract_metadata(
+        etherscan_client,
+        [a for a in df[address_column] if not pd.isna(a) and str(a).strip() != ""],
+    )
+
+    # Collect results positionally and assign whole columns once at the end
+    name_tags = df["name_tag"].tolist() if "name_tag" in df.columns else [None] * total
+    contract_names = (
+        df["contract_name"].tolist()
+        if "contract_name" in df.columns
+        else [None] * total
+    )
+
     # Scrape name tags
     with EtherscanScraper(headless=headless, timeout=timeout) as scraper:
-        for idx, row in df.iterrows():
-            address = row[address_column]
-
+        for i, address in enumerate(df[address_column].to_numpy()):
             # Skip if address is None or empty
             if pd.isna(address) or str(address).strip() == "":
-                logger.debug(f"Skipping empty address at row {idx}")
+                logger.debug(f"Skipping empty address at row {i}")
                 continue
 
             try:
                 name_tag = scraper.get_contract_name_tag(str(address))
-                contract_metadata = etherscan_client.get_contract_metadata(address)
-                df.at[idx, "name_tag"] = name_tag
-                df.at[idx, "contract_name"] = contract_metadata["ContractName"]
+                if isinstance(metadata[address], Exception):
+                    raise metadata[address]
+                contract_name, _ = metadata[address]
+                name_tags[i] = name_tag
+                contract_names[i] = contract_name
                 logger.info(
-                    f"[{idx + 1}/{total}] {address}: {name_tag or 'No tag found'} {contract_metadata['ContractName'] or 'No name found'}"
+                    f"[{i + 1}/{total}] {address}: {name_tag or 'No tag found'} {contract_name or 'No name found'}"
                 )
             except Exception as e:
-                logger.warning(f"[{idx + 1}/{total}] {address}: Error - {e}")
-                df.at[idx, "name_tag"] = None
+                logger.warning(f"[{i + 1}/{total}] {address}: Error - {e}")
+                name_tags[i] = None
+
+    df = df.assign(name_tag=name_tags, contract_name=contract_names)
 
     # Log summary
     tagged_count = df["name_tag"].notna().sum()
@@ -137,6 +296,13 @@ def main():
         help="Maximum wait time for page elements in seconds (default: 10)",
     )
 
+    parser.add_argument(
+        "--browser-workers",
+        type=int,
+        default=4,
+        help="Number of browsers scraping in parallel (default: 4)",
+    )
+
     parser.add_argument(
         "--save-every",
         type=int,
@@ -144,6 +310,19 @@ def main():
         help="Save progress every N rows (default: 100)",
     )
 
+    parser.add_argument(
+        "--cache-ttl-days",
+        type=float,
+        default=30,
+        help="Reuse contract metadata cached by earlier runs for N days (default: 30)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the contract metadata cache",
+    )
+
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose logging"
     )
@@ -165,14 +344,26 @@ def main():
             )
             raise ValueError(f"Column '{args.address_column}' not found")
 
-        # Check if output file exists to determine already processed addresses
+        # Check if output file exists to determine already processed addresses.
+        # An empty file (a run stopped before its first save) counts as new.
         processed_addresses = set()
-        if Path(args.output).exists():
+        # Running totals over the whole output file, for the final summary
+        counts = {"rows": 0, "tagged": 0, "named": 0}
+        try:
+            output_exists = Path(args.output).stat().st_size > 0
+        except FileNotFoundError:
+            output_exists = False
+        if output_exists:
             logger.info(f"Loading existing progress from: {args.output}")
             existing_df = pd.read_csv(args.output)
             processed_addresses = set(
                 existing_df[args.address_column].dropna().astype(str).str.lower()
             )
+            counts["rows"] = len(existing_df)
+            if "name_tag" in existing_df.columns:
+                counts["tagged"] = int(existing_df["name_tag"].notna().sum())
+            if "contract_name" in existing_df.columns:
+                counts["named"] = int(existing_df["contract_name"].notna().sum())
             logger.info(f"Found {len(processed_addresses)} already processed addresses")
 
         total = len(df)
@@ -181,87 +372,154 @@ def main():
         # Initialize Etherscan client
         etherscan_client = EtherscanClient(chain="ethereum")
 
-        # Buffer to collect results before appending
-        results_buffer = []
-
-        # Scrape with periodic saves
-        with EtherscanScraper(
-            headless=not args.no_headless, timeout=args.timeout
-        ) as scraper:
-            for idx, row in df.iterrows():
-                address = row[args.address_column]
-
-                # Skip if address is None or empty
-                if pd.isna(address) or str(address).strip() == "":
-                    logger.debug(f"Skipping empty address at row {idx}")
-                    continue
-
-                # Skip if already processed
-                if str(address).lower() in processed_addresses:
-                    logger.debug(f"Skipping already processed address: {address}")
-                    continue
+        # Select the rows still to scrape with one vectorized mask: skip empty
+        # addresses and addresses already in the output
+        addresses = df[args.address_column]
+        addr_lower = addresses.astype(str).str.lower()
+        pending_mask = (
+            addresses.notna()
+            & addr_lower.str.strip().ne("")
+            & ~addr_lower.isin(processed_addresses)
+        )
+        pending_rows = pending_mask.to_numpy().nonzero()[0]
+        pending_addresses = addresses.to_numpy()[pending_rows].tolist()
+        # Each distinct address is looked up once, in order of first
+        # appearance; rows repeating an address reuse its result
+        unique_addresses = list(dict.fromkeys(pending_addresses))
+        logger.info(f"{len(unique_addresses)} addresses left to scrape")
+        if not unique_addresses:
+            logger.info("Nothing to scrape")
+            return
+        # No more browsers than addresses: each one takes seconds to start
+        n_browsers = min(args.browser_workers, len(unique_addresses))
+
+        def prefetch_metadata() -> dict:
+            cache = (
+                None
+                if args.no_cache
+                else MetadataCache(
+                    METADATA_CACHE_DIR / f"{etherscan_client.chain}.sqlite",
+                    ttl_days=args.cache_ttl_days,
+                )
+            )
+            try:
+                return fetch_contract_metadata(
+                    etherscan_client,
+                    unique_addresses,
+                    with_creation_block=True,
+                    cache=cache,
+                )
+            finally:
+                if cache:
+                    cache.close()
+
+        # Buffer results as columns (row positions plus scraped values) and
+        # build each appended batch from them in one go
+        buffer_rows, name_tags, contract_names, is_contract = [], [], [], []
+
+        def flush_buffer(sink) -> None:
+            # assign() keeps existing scraped columns in place and appends new
+            # ones, so the columns come out as they did with row dicts
+            append_df = df.iloc[buffer_rows].assign(
+                name_tag=name_tags,
+                contract_name=contract_names,
+                is_contract=is_contract,
+            )
+            # The file is opened for appending, so a non-zero position means
+            # the header is already there
+            append_df.to_csv(sink, header=sink.tell() == 0, index=False)
+            sink.flush()
+
+            counts["rows"] += len(buffer_rows)
+            # Empty strings are written as empty CSV fields, i.e. missing values
+            counts["tagged"] += sum(bool(tag) for tag in name_tags)
+            counts["named"] += sum(bool(name) for name in contract_names)
+            for column in (buffer_rows, name_tags, contract_names, is_contract):
+                column.clear()
+
+        # Scrape with periodic saves, keeping the output file open
+        with ExitStack() as stack:
+            # Look up contract metadata from the API in the background while
+            # the browsers start and scrape
+            metadata_executor = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+            metadata_future = metadata_executor.submit(prefetch_metadata)
+
+            # Each browser is used by one thread at a time, checked out of a queue
+            scraper_pool = queue.Queue()
+            for _ in range(n_browsers):
+                scraper_pool.put(
+                    stack.enter_context(
+                        EtherscanScraper(
+                            headless=not args.no_headless, timeout=args.timeout
+                        )
+                    )
+                )
 
+            def scrape_name_tag(address):
+                scraper = scraper_pool.get()
                 try:
-                    name_tag = scraper.get_contract_name_tag(str(address))
-                    contract_metadata = etherscan_client.get_contract_metadata(address)
-                    creation_block_number = (
-                        etherscan_client.get_contract_creation_block_number(address)
-                    )
+                    return scraper.get_contract_name_tag(str(address))
+                except Exception as e:
+                    return e
+                finally:
+                    scraper_pool.put(scraper)
+
+            sink = stack.enter_context(open(args.output, "a", newline=""))
+            # Registered last so it runs first on exit: drop queued scrapes
+            # before the browsers are closed
+            scrape_executor = ThreadPoolExecutor(max_workers=n_browsers)
+            stack.callback(scrape_executor.shutdown, cancel_futures=True)
+
+            # map() yields results in input order, so rows are saved in order:
+            # a row with a new address always needs the next result
+            name_tag_results = scrape_executor.map(scrape_name_tag, unique_addresses)
+            name_tag_by_address = {}
+            metadata = metadata_future.result()
+
+            for i, address in zip(pending_rows, pending_addresses):
+                if address not in name_tag_by_address:
+                    name_tag_by_address[address] = next(name_tag_results)
+                name_tag = name_tag_by_address[address]
+                try:
+                    if isinstance(name_tag, Exception):
+                        raise name_tag
+                    if isinstance(metadata[address], Exception):
+                        raise metadata[address]
+                    contract_name, creation_block_number = metadata[address]
 
                     # Add to buffer
-                    result = row.to_dict()
-                    result["name_tag"] = name_tag
-                    result["contract_name"] = contract_metadata["ContractName"]
-                    result["is_contract"] = creation_block_number is not None
-                    results_buffer.append(result)
+                    buffer_rows.append(i)
+                    name_tags.append(name_tag)
+                    contract_names.append(contract_name)
+                    is_contract.append(creation_block_number is not None)
 
                     logger.info(
-                        f"[{idx + 1}/{total}] {address}: {name_tag or 'No tag found'} | {contract_metadata['ContractName'] or 'No name found'}"
+                        f"[{i + 1}/{total}] {address}: {name_tag or 'No tag found'} | {contract_name or 'No name found'}"
                     )
                 except Exception as e:
-                    logger.warning(f"[{idx + 1}/{total}] {address}: Error - {e}")
-                    result = row.to_dict()
-                    result["name_tag"] = None
-                    result["contract_name"] = None
-                    result["is_contract"] = False
-                    results_buffer.append(result)
+                    logger.warning(f"[{i + 1}/{total}] {address}: Error - {e}")
+                    buffer_rows.append(i)
+                    name_tags.append(None)
+                    contract_names.append(None)
+                    is_contract.append(False)
 
                 # Append to CSV every N rows
-                if len(results_buffer) >= args.save_every:
-                    append_df = pd.DataFrame(results_buffer)
-                    append_df.to_csv(
-                        args.output,
-                        mode="a",
-                        header=not Path(args.output).exists(),
-                        index=False,
-                    )
-                    logger.info(f"Appended {len(results_buffer)} rows to {args.output}")
-
-                    # Add newly saved addresses to processed set
-                    processed_addresses.update(
-                        append_df[args.address_column].astype(str).str.lower()
-                    )
-                    results_buffer = []
-
-        # Append remaining results
-        if results_buffer:
-            append_df = pd.DataFrame(results_buffer)
-            append_df.to_csv(
-                args.output,
-                mode="a",
-                header=not Path(args.output).exists(),
-                index=False,
-            )
-            logger.info(f"Appended final {len(results_buffer)} rows to {args.output}")
-
-        # Read final output for summary
-        final_df = pd.read_csv(args.output)
-        tagged_count = final_df["name_tag"].notna().sum()
-        named_count = final_df["contract_name"].notna().sum()
+                if len(buffer_rows) >= args.save_every:
+                    n_rows = len(buffer_rows)
+                    flush_buffer(sink)
+                    logger.info(f"Appended {n_rows} rows to {args.output}")
+
+            # Append remaining results
+            if buffer_rows:
+                n_rows = len(buffer_rows)
+                flush_buffer(sink)
+                logger.info(f"Appended final {n_rows} rows to {args.output}")
+
+        # Summarize from the running totals instead of re-reading the output
         logger.info(
-            f"Completed: {tagged_count}/{len(final_df)} addresses tagged, {named_count}/{len(final_df)} addresses named"
+            f"Completed: {counts['tagged']}/{counts['rows']} addresses tagged, {counts['named']}/{counts['rows']} addresses named"
         )
-        logger.info(f"Total rows in output: {len(final_df)}")
+        logger.info(f"Total rows in output: {counts['rows']}")
 
     except KeyboardInterrupt:
         logger.warning("Scraping interrupted by user")
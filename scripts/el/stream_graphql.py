@@ -1,22 +1,16 @@
 #!/usr/bin/env python3
 """
-GraphQL data fetcher with streaming and batch modes.
+GraphQL data fetcher, streaming mode.
 
-This script fetches data from a GraphQL endpoint and either:
-1. Saves to Parquet file (batch mode)
-2. Pushes directly to database (streaming mode)
+This script continuously polls a GraphQL endpoint and pushes new records
+directly to the database. Batch extraction to Parquet is extract_graphql.py.
 """
 
-import argparse, json, logging
-from pathlib import Path
+import argparse, logging
 
 from dotenv import load_dotenv
 
 load_dotenv()
-from onchaindata.data_pipeline import Loader
-from onchaindata.utils import PostgresClient, SnowflakeClient
-
-from onchaindata.data_extraction import GraphQLStream
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +22,10 @@ def stream(args):
     Args:
         args: Parsed command-line arguments
     """
+    from onchaindata.data_pipeline import Loader
+    from onchaindata.utils import PostgresClient, SnowflakeClient
+    from onchaindata.data_extraction import GraphQLStream
+
     # Validate arguments
     if not all([args.database_client, args.schema, args.database_table, args.fields]):
         raise ValueError(
@@ -53,6 +51,7 @@ def stream(args):
         table_name=args.graphql_table,
         fields=fields,
         poll_interval=args.poll_interval,
+        max_poll_interval=args.max_poll_interval,
     )
 
     streamer.stream(
@@ -64,7 +63,7 @@ def stream(args):
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Fetch data from GraphQL endpoint with streaming or batch mode"
+        description="Stream data from a GraphQL endpoint into the database"
     )
 
     # GraphQL endpoint configuration
@@ -88,6 +87,12 @@ def main():
         default=5,
         help="Polling interval in seconds for streaming mode (default: 5)",
     )
+    parser.add_argument(
+        "--max-poll-interval",
+        type=int,
+        default=30,
+        help="Longest wait in seconds between empty polls, which back off 1.5x each (default: 30)",
+    )
 
     parser.add_argument(
         "--fields",
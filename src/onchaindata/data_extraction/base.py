@@ -3,6 +3,7 @@
 import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Type, Callable
@@ -42,12 +43,21 @@ class BaseAPIClient(ABC):
         self._session = self._create_session()
 
     def _create_session(self) -> RateLimitedSession:
-        """Create configured session with rate limiting."""
-        return RateLimitedSession(
+        """Create configured session with rate limiting.
+
+        The session keeps a pool of keep-alive connections per host, large enough
+        for threads sharing the client, so requests skip the TCP/TLS handshake.
+        Retries are left to `make_request`.
+        """
+        session = RateLimitedSession(
             calls_per_second=self.config.rate_limit,
             strategy=self.rate_limit_strategy,
             logger=self.logger,
         )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     @abstractmethod
     def _build_request_params(self, **kwargs) -> Dict[str, Any]:
@@ -1,6 +1,6 @@
 """Etherscan API client implementation."""
 
-import os, json, csv, logging
+import os, json, csv, functools, logging, threading
 
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 
 import polars as pl
 import dlt
+
 from dlt.sources.rest_api import rest_api_source
 from dlt.sources.helpers.rest_client import paginators
 
@@ -17,6 +18,24 @@ from .base import APIError
 
 logger = logging.getLogger(__name__)
 
+# Serializes read-modify-write of the output parquet and error CSV files, which
+# concurrent extractions (e.g. parallel retries) may share
+_file_lock = threading.Lock()
+
+# Columns identifying a unique record in each extracted table
+PRIMARY_KEYS: Dict[str, List[str]] = {
+    "logs": ["transactionHash", "logIndex"],
+    "transactions": ["hash"],
+}
+
+# Large row groups keep the footer small and let readers skip by block statistics
+PARQUET_WRITE_OPTIONS: Dict[str, Any] = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 1_000_000,
+    "statistics": True,
+}
+
 
 @dataclass
 class APIs:
@@ -46,8 +65,13 @@ class EtherscanClient(BaseAPIClient):
     """Etherscan API client implementation."""
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _load_chainid_mapping(cls) -> Dict[str, int]:
-        """Load chain name to chainid mapping from resource file."""
+        """Load chain name to chainid mapping from resource file.
+
+        The file is read once per process; every client shares the result,
+        which must not be mutated.
+        """
         # Get the path to the chainid.json file relative to this module
         current_file = Path(__file__)
         chainid_path = current_file.parent.parent / "config" / "chainid.json"
@@ -214,6 +238,36 @@ class EtherscanClient(BaseAPIClient):
             logger.warning(f"Could not get contract creation block number for")
             return None
 
+    def get_contract_creation_block_numbers(
+        self, addresses: List[str], batch_size: int = 5
+    ) -> Dict[str, Optional[int]]:
+        """Get contract creation block numbers, looking up `batch_size` addresses per request.
+
+        getcontractcreation accepts up to 5 addresses at once. Addresses that are
+        not contracts, or whose lookup failed, map to None.
+        """
+        block_numbers: Dict[str, Optional[int]] = {
+            address: None for address in addresses
+        }
+        by_lower = {address.lower(): address for address in addresses}
+
+        for start in range(0, len(addresses), batch_size):
+            batch = addresses[start : start + batch_size]
+            try:
+                result = self.get_contract_creation_info(batch)
+            except Exception as e:
+                logger.warning(
+                    f"Could not get contract creation block numbers for {batch}: {e}"
+                )
+                continue
+
+            for info in result if isinstance(result, list) else [result]:
+                address = by_lower.get((info or {}).get("contractAddress", "").lower())
+                if address is not None and info.get("blockNumber"):
+                    block_numbers[address] = int(info["blockNumber"])
+
+        return block_numbers
+
     def get_transaction_receipt(
         self, txhash: str, save: bool = True, save_dir: str = "data/receipts"
     ) -> Dict[str, Any]:
@@ -434,6 +488,23 @@ class EtherscanExtractor:
         extractor = EtherscanExtractor(etherscan_client)
     """
 
+    # Fields converted to int by _process_hex_fields, built once rather than per record
+    NUMERIC_FIELDS = frozenset(
+        {
+            "blockNumber",
+            "timeStamp",
+            "logIndex",
+            "transactionIndex",
+            "gasPrice",
+            "gasUsed",
+            "nonce",
+            "value",
+            "gas",
+            "cumulativeGasUsed",
+            "confirmations",
+        }
+    )
+
     def __init__(
         self,
         client: EtherscanClient,
@@ -537,21 +608,7 @@ class EtherscanExtractor:
 
     def _process_hex_fields(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """Convert numeric string fields to integers (handles both hex and decimal formats)."""
-        numeric_fields = {
-            "blockNumber",
-            "timeStamp",
-            "logIndex",
-            "transactionIndex",
-            "gasPrice",
-            "gasUsed",
-            "nonce",
-            "value",
-            "gas",
-            "cumulativeGasUsed",
-            "confirmations",
-        }
-
-        for field in numeric_fields:
+        for field in self.NUMERIC_FIELDS:
             if field in record and isinstance(record[field], str):
                 str_value = record[field].strip()
                 if str_value and str_value != "0x":
@@ -585,33 +642,46 @@ class EtherscanExtractor:
     ) -> str:
         """Save data to Parquet file organized by chain_address_table_from_block_to_block."""
         try:
-            # Create Polars DataFrame
-            new_lf = pl.LazyFrame(data)
-
-            # Save to Parquet (append if file exists)
-            if output_path.exists():
-                # Use scan_parquet for memory efficiency, then concatenate and collect
-                existing_lf = pl.scan_parquet(output_path)
-
-                # Ensure column order matches between existing and new data
-                existing_columns = existing_lf.collect_schema().names()
-                new_lf = new_lf.select(existing_columns)
-
-                combined_lf = pl.concat([existing_lf, new_lf]).unique()
-                combined_lf.collect().write_parquet(output_path)
+            with _file_lock:
+                # Create Polars DataFrame
+                new_lf = pl.LazyFrame(data)
+
+                # Save to Parquet (append if file exists)
+                if output_path.exists():
+                    # Use scan_parquet for memory efficiency, then concatenate and collect
+                    existing_lf = pl.scan_parquet(output_path)
+
+                    # Ensure column order matches between existing and new data
+                    existing_columns = existing_lf.collect_schema().names()
+                    new_lf = new_lf.select(existing_columns)
+
+                    # Dedup on the table's key only instead of hashing every column
+                    combined_lf = pl.concat([existing_lf, new_lf])
+                    primary_key = PRIMARY_KEYS.get(table, [])
+                    if primary_key and set(primary_key) <= set(existing_columns):
+                        combined_lf = combined_lf.unique(
+                            subset=primary_key, keep="first"
+                        )
+                    # Concatenation leaves the frame in many chunks; rechunk
+                    # so the file is written as a few large row groups
+                    combined_lf.collect().rechunk().write_parquet(
+                        output_path, **PARQUET_WRITE_OPTIONS
+                    )
 
-                logger.info(
-                    f"{chain} - {address} - {table} - {from_block}-{to_block}: {len(data)} saved"
-                )
+                    logger.info(
+                        f"{chain} - {address} - {table} - {from_block}-{to_block}: {len(data)} saved"
+                    )
 
-            else:
-                # Write new file
-                new_lf.collect().write_parquet(output_path)
-                logger.info(
-                    f"{chain} - {address} - {table} - {from_block}-{to_block}: {len(data)} saved"
-                )
+                else:
+                    # Write new file
+                    new_lf.collect().rechunk().write_parquet(
+                        output_path, **PARQUET_WRITE_OPTIONS
+                    )
+                    logger.info(
+                        f"{chain} - {address} - {table} - {from_block}-{to_block}: {len(data)} saved"
+                    )
 
-            return output_path
+                return output_path
 
         except Exception as e:
             logger.error(f"Failed to save data: {e}")
@@ -649,18 +719,14 @@ def etherscan_to_parquet(
     address = address.lower()
     chain = etherscan_client.chain
 
-    end_block = to_block
-
-    assert from_block < to_block, "from_block must be less than to_block"
-    assert (
-        block_chunk_size < to_block - from_block
-    ), "block_chunk_size must be less than to_block - from_block"
-
-    for chunk_start in range(
-        from_block, end_block - block_chunk_size + 1, block_chunk_size
-    ):
-        chunk_end = min(chunk_start + block_chunk_size, end_block)
+    assert from_block <= to_block, "from_block must not be greater than to_block"
+    assert block_chunk_size > 0, "block_chunk_size must be positive"
 
+    # Consecutive chunks share their boundary block; a range no longer than
+    # one chunk (down to a single block) is fetched in one request
+    chunk_start = from_block
+    while True:
+        chunk_end = min(chunk_start + block_chunk_size, to_block)
         extractor.to_parquet(
             address=address,
             chain=chain,
@@ -670,16 +736,9 @@ def etherscan_to_parquet(
             offset=1000,
             output_path=output_path,
         )
-    if chunk_end < end_block:
-        extractor.to_parquet(
-            address=address,
-            chain=chain,
-            table=table,
-            from_block=chunk_end,
-            to_block=end_block,
-            offset=1000,
-            output_path=output_path,
-        )
+        if chunk_end >= to_block:
+            break
+        chunk_start = chunk_end
     return output_path
 
 
@@ -705,26 +764,27 @@ def _log_error_to_csv(
         "block_chunk_size",
     ]
 
-    # Check if file exists to determine if we need to write headers
-    file_exists = error_file.exists()
-
-    # Append error to CSV file immediately
-    with error_file.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-
-        # Write headers if this is a new file
-        if not file_exists:
-            writer.writerow(csv_headers)
-
-        timestamp = datetime.now().isoformat()
-
-        writer.writerow(
-            [
-                timestamp,
-                address,
-                chain,
-                from_block,
-                to_block,
-                block_chunk_size,
-            ]
-        )
+    with _file_lock:
+        # Check if file exists to determine if we need to write headers
+        file_exists = error_file.exists()
+
+        # Append error to CSV file immediately
+        with error_file.open("a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+
+            # Write headers if this is a new file
+            if not file_exists:
+                writer.writerow(csv_headers)
+
+            timestamp = datetime.now().isoformat()
+
+            writer.writerow(
+                [
+                    timestamp,
+                    address,
+                    chain,
+                    from_block,
+                    to_block,
+                    block_chunk_size,
+                ]
+            )
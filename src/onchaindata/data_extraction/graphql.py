@@ -7,7 +7,8 @@ This module extracts data from a GraphQL endpoint and either:
 2. Pushes directly to database (streaming mode)
 """
 
-import time, logging
+import random, time, logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 
 import requests
@@ -93,6 +94,7 @@ class GraphQLStream:
         table_name: str,
         fields: List[str],
         poll_interval: int = 5,
+        max_poll_interval: int = 30,
     ):
         """
         Initialize streaming fetcher.
@@ -101,12 +103,15 @@ class GraphQLStream:
             endpoint: GraphQL endpoint URL
             table_name: Name of the table/query to fetch
             fields: List of fields to fetch
-            poll_interval: Seconds to wait between polls
+            poll_interval: Seconds to wait after a poll that returned records
+            max_poll_interval: Upper bound for the wait, which grows 1.5x after
+                               each empty poll
         """
         self.endpoint = endpoint
         self.table_name = table_name
         self.fields = fields
         self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
         self.last_seen_block_number: Optional[int] = None
 
     def _build_query(self, where_clause: Optional[str] = None) -> str:
@@ -188,6 +193,18 @@ class GraphQLStream:
         poll_count = 1
         total_records = 0
 
+        # One fetcher (and HTTP session) for the whole stream; only its query changes
+        extractor = GraphQLBatch(endpoint=self.endpoint, query="")
+
+        # Loads run on a single background thread, in poll order, so the next
+        # poll is issued while the previous batch is still being written. At
+        # most one load is pending at a time, which bounds memory.
+        pending_load: Optional[Future] = None
+
+        # Back off while the endpoint has nothing new; reset once records arrive
+        interval = self.poll_interval
+
+        load_executor = ThreadPoolExecutor(max_workers=1)
         try:
             while True:
                 # Build query with current state
@@ -198,12 +215,7 @@ class GraphQLStream:
                         f"blockNumber: {{_gt: {self.last_seen_block_number}}}"
                     )
 
-                query = self._build_query(where_clause)
-
-                extractor = GraphQLBatch(
-                    endpoint=self.endpoint,
-                    query=query,
-                )
+                extractor.query = self._build_query(where_clause)
 
                 # Fetch data
                 df = extractor.extract_to_dataframe(self.table_name)
@@ -211,32 +223,48 @@ class GraphQLStream:
                     records_count = len(df)
                     total_records += records_count
 
-                    # Load DataFrame directly to database
-                    loader.load_dataframe(
+                    # Wait for the previous batch, then load this one in the background
+                    if pending_load is not None:
+                        pending_load.result()
+                    pending_load = load_executor.submit(
+                        loader.load_dataframe,
                         df=df,
                         schema=schema,
                         table_name=table_name,
                         write_disposition="append",
                     )
 
-                    # Update last seen value
+                    # Update last seen value as soon as the batch is fetched,
+                    # so the next poll does not wait for the load
                     if "blockNumber" in df.columns:
                         self.last_seen_block_number = df["blockNumber"].max()
                         logger.info(
-                            f"[Poll {poll_count}] - {records_count} new records, new max block number in the database: {self.last_seen_block_number}"
+                            f"[Poll {poll_count}] - {records_count} new records, new max block number: {self.last_seen_block_number}"
                         )
 
                     poll_count += 1
+                    interval = self.poll_interval
                 else:
                     logger.info(
-                        f"[Poll {poll_count}] - No records fetched, waiting for next poll..."
+                        f"[Poll {poll_count}] - No records fetched, next poll in {interval:.1f}s..."
                     )
                     poll_count += 1
 
-                # Wait before next poll
-                time.sleep(self.poll_interval)
+                # Wait before next poll, with jitter so several streams
+                # against one endpoint do not poll in lockstep
+                time.sleep(interval + random.uniform(0, 0.25 * interval))
+                if df.is_empty():
+                    interval = min(interval * 1.5, self.max_poll_interval)
 
         except KeyboardInterrupt:
             logger.info(f"\n\nStreaming stopped by user.")
             logger.info(f"Total polls: {poll_count}")
             logger.info(f"Total records: {total_records}")
+        finally:
+            # Wait for the last load before shutting down, so the process does
+            # not exit mid-load and a failed load is raised instead of lost
+            try:
+                if pending_load is not None:
+                    pending_load.result()
+            finally:
+                load_executor.shutdown()
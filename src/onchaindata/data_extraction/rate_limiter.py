@@ -2,6 +2,7 @@
 
 import time
 import logging
+import threading
 import requests
 from enum import Enum
 from typing import Optional
@@ -29,11 +30,14 @@ class RateLimitedSession(requests.Session):
         self.last_request_time = 0
         self.request_count = 0
         self.min_interval = 1.0 / calls_per_second
+        # Shared by threads using the same session, so the limit holds across them
+        self._lock = threading.Lock()
         
     def request(self, method: str, url: str, **kwargs) -> requests.Response:
         """Make a rate-limited request."""
-        self._apply_rate_limiting()
-        self.request_count += 1
+        with self._lock:
+            self._apply_rate_limiting()
+            self.request_count += 1
         response = super().request(method, url, **kwargs)
         return response
         
@@ -2,16 +2,27 @@
 
 """Unified loader for loading Parquet files to various destinations."""
 
-import os
+import glob, itertools, math, os, re, tempfile, time, uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import Iterable, List, Optional, Union
 
 import dlt
-from dlt.sources.filesystem import filesystem, read_parquet
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from ..utils import PostgresClient, SnowflakeClient
 
+# Target size of each Parquet chunk uploaded to a Snowflake stage
+COPY_CHUNK_BYTES = 250 * 1024 * 1024
+# Rows per Parquet chunk when staging an in-memory DataFrame to Snowflake
+COPY_CHUNK_ROWS = 250_000
+# Rows per Arrow record batch handed to DLT
+ARROW_BATCH_SIZE = 64_000
+# Environment flag values that turn an option on
+TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes"})
+
 
 class Loader:
     """Unified loader class for loading data to different destinations."""
@@ -28,6 +39,8 @@ class Loader:
                    If not provided, will be created from environment variables
         """
         self.client = client
+        # (session id, stage) pairs whose temporary stage and file format exist
+        self._snowflake_sessions_ready = set()
 
     def load_parquet(
         self,
@@ -35,49 +48,387 @@ class Loader:
         schema: str,
         table_name: str,
         write_disposition: str = "append",
+        primary_key: list[str] = None,
     ):
         """
         Load Parquet file to the configured destination using DLT.
 
+        The file is streamed in Arrow record batches, so memory use does not
+        grow with the file size.
+
+        For Snowflake, "append" and "replace" loads can bypass DLT and use a
+        bulk PUT + COPY INTO instead (see `_copy_parquet_to_snowflake`); set
+        SNOWFLAKE_LOAD_WITH_COPY=1 to opt in.
+
         Args:
-            file_path: Path to the Parquet file
+            file_path: Path to the Parquet file, or a glob pattern matching several
             schema: Target schema name
             table_name: Target table name
             write_disposition: How to handle existing data ("append", "replace", "merge")
+            primary_key: List of column names to use as primary key for merge operations.
+                        Required when write_disposition="merge".
 
         Returns:
-            DLT pipeline run result
+            DLT pipeline run result, or the number of rows loaded by COPY INTO
         """
+        # Validate merge requirements
+        if write_disposition == "merge" and not primary_key:
+            raise ValueError(
+                "primary_key must be specified when write_disposition='merge'. "
+                "Example: primary_key=['contract_address', 'chain']"
+            )
+
         # Convert Path to string if needed
         if isinstance(file_path, Path):
             file_path = file_path.as_posix()
 
-        # Create filesystem source
-        fs_source = filesystem(bucket_url=".", file_glob=file_path)
+        if self._use_snowflake_copy(write_disposition):
+            return self._copy_parquet_to_snowflake(
+                file_path, schema, table_name, write_disposition
+            )
+
+        file_paths = _expand_parquet_paths(file_path)
+
+        arrow_schema = pq.read_schema(file_paths[0])
+
+        def _read_parquet_batches():
+            # Stream Arrow record batches; DLT loads them without row dicts
+            for path in file_paths:
+                parquet_file = pq.ParquetFile(path)
+                yield from parquet_file.iter_batches(batch_size=ARROW_BATCH_SIZE)
 
         # Read parquet with special handling for logs table
-        parquet_resource = fs_source | read_parquet()
+        parquet_resource = dlt.resource(
+            self._dlt_items(_read_parquet_batches(), arrow_schema), name=table_name
+        )
         if table_name == "logs":
             parquet_resource.apply_hints(
                 columns={"topics": {"data_type": "json", "nullable": True}}
             )
+        # Apply primary key hint for merge operations
+        if primary_key:
+            parquet_resource.apply_hints(primary_key=primary_key)
 
         # Create pipeline with destination-specific configuration
-        pipeline = dlt.pipeline(
-            pipeline_name="parquet_loader",
-            destination=self.client.get_dlt_destination(),
-            dataset_name=schema,
-        )
+        pipeline = self._dlt_pipeline("parquet_loader", schema)
 
         # Load data
         result = pipeline.run(
             parquet_resource,
             table_name=table_name,
             write_disposition=write_disposition,
+            loader_file_format=self._loader_file_format(arrow_schema),
         )
 
         return result
 
+    def _dlt_pipeline(self, pipeline_name: str, schema: str):
+        """
+        Create a DLT pipeline for the client's destination.
+
+        DLT only adds its _dlt_load_id/_dlt_id columns to Arrow data when asked
+        to. The setting is scoped to this pipeline name, so Arrow loads stay
+        compatible with tables created from row dicts without changing the
+        config of other DLT pipelines in the process.
+
+        Args:
+            pipeline_name: DLT pipeline name
+            schema: Target schema (DLT dataset) name
+
+        Returns:
+            DLT pipeline
+        """
+        for option in ("add_dlt_load_id", "add_dlt_id"):
+            dlt.config[f"{pipeline_name}.normalize.parquet_normalizer.{option}"] = True
+        return dlt.pipeline(
+            pipeline_name=pipeline_name,
+            destination=self.client.get_dlt_destination(),
+            dataset_name=schema,
+        )
+
+    def _use_snowflake_copy(self, write_disposition: str) -> bool:
+        """
+        Whether a load goes through PUT + COPY INTO instead of DLT.
+
+        Only Snowflake "append" and "replace" loads qualify, and only when
+        SNOWFLAKE_LOAD_WITH_COPY is 1, true or yes. DLT stays the default,
+        since it also maintains its load bookkeeping tables.
+        """
+        return (
+            isinstance(self.client, SnowflakeClient)
+            and write_disposition != "merge"
+            and os.getenv("SNOWFLAKE_LOAD_WITH_COPY", "").strip().lower()
+            in TRUTHY_ENV_VALUES
+        )
+
+    def _nested_for_postgres(self, arrow_schema: pa.Schema) -> bool:
+        """Whether data bound for PostgreSQL has nested (e.g. list) columns."""
+        return isinstance(self.client, PostgresClient) and any(
+            pa.types.is_nested(field.type) for field in arrow_schema
+        )
+
+    def _loader_file_format(self, arrow_schema: pa.Schema):
+        """
+        Pick the DLT loader file format for an Arrow schema.
+
+        Flat data bound for PostgreSQL is written as CSV, which DLT loads with
+        COPY FROM STDIN instead of batched INSERT statements. pyarrow cannot
+        write nested columns (e.g. logs' `topics`) to CSV, so such data is
+        loaded from row dicts with INSERT statements (see `_dlt_items`). Other
+        destinations keep DLT's default format.
+
+        Args:
+            arrow_schema: Schema of the data being loaded
+
+        Returns:
+            "csv", "insert_values", or None for the destination's default
+        """
+        if not isinstance(self.client, PostgresClient):
+            return None
+        if self._nested_for_postgres(arrow_schema):
+            return "insert_values"
+        return "csv"
+
+    def _dlt_items(
+        self, batches: Iterable[pa.RecordBatch], arrow_schema: pa.Schema
+    ) -> Iterable:
+        """
+        Prepare Arrow record batches for a DLT resource.
+
+        DLT writes Arrow data bound for PostgreSQL as CSV even when another
+        loader file format is requested, and its CSV writer rejects list
+        columns. Such batches are converted to row dicts, which DLT normalizes
+        itself (nested columns become JSON); everything else stays Arrow.
+
+        Args:
+            batches: Arrow record batches to load
+            arrow_schema: Schema of the batches
+
+        Returns:
+            The batches, or an iterator over their rows as dicts
+        """
+        if self._nested_for_postgres(arrow_schema):
+            return (row for batch in batches for row in batch.to_pylist())
+        return batches
+
+    def _copy_parquet_to_snowflake(
+        self,
+        file_path: str,
+        schema: str,
+        table_name: str,
+        write_disposition: str = "append",
+        put_workers: int = 8,
+    ) -> int:
+        """
+        Bulk load a Parquet file to Snowflake with PUT + COPY INTO.
+
+        The file is rewritten as chunks of at most ~250 MB, uploaded to a temporary
+        internal stage by parallel PUT workers, and loaded with a single COPY.
+        The table is created from the staged files' inferred schema if missing
+        (or recreated for "replace"). Column names are normalized to upper
+        snake_case, matching the identifiers DLT creates on Snowflake, and
+        DLT's _dlt_load_id/_dlt_id columns are added (see `_with_dlt_columns`).
+        Parquet is decoded with the vectorized scanner unless the client
+        disables it; the scanner requires ON_ERROR = ABORT_STATEMENT, which
+        COPY uses anyway.
+
+        Args:
+            file_path: Path to the Parquet file, or a glob pattern matching several
+            schema: Target schema name
+            table_name: Target table name
+            write_disposition: "append" or "replace"
+            put_workers: Number of concurrent PUT uploads
+
+        Returns:
+            Number of rows loaded
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            _split_parquet(file_path, Path(tmp_dir), _new_load_id())
+            return self._copy_chunks_to_snowflake(
+                tmp_dir, schema, table_name, write_disposition, put_workers
+            )
+
+    def _copy_dataframe_to_snowflake(
+        self,
+        df: pl.DataFrame,
+        schema: str,
+        table_name: str,
+        write_disposition: str = "append",
+        put_workers: int = 8,
+    ) -> int:
+        """
+        Bulk load a Polars DataFrame to Snowflake with PUT + COPY INTO.
+
+        The frame is written straight from Arrow memory as Parquet chunks of
+        `COPY_CHUNK_ROWS` rows, with DLT's _dlt_load_id/_dlt_id columns added,
+        then staged and copied exactly like `_copy_parquet_to_snowflake`.
+
+        Args:
+            df: Polars DataFrame to load
+            schema: Target schema name
+            table_name: Target table name
+            write_disposition: "append" or "replace"
+            put_workers: Number of concurrent PUT uploads
+
+        Returns:
+            Number of rows loaded
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            _split_dataframe(df, Path(tmp_dir), _new_load_id())
+            return self._copy_chunks_to_snowflake(
+                tmp_dir, schema, table_name, write_disposition, put_workers
+            )
+
+    def _copy_chunks_to_snowflake(
+        self,
+        chunk_dir: str,
+        schema: str,
+        table_name: str,
+        write_disposition: str,
+        put_workers: int,
+    ) -> int:
+        """Stage the part_*.parquet files of `chunk_dir` and COPY them into the table."""
+        with self.client.get_connection() as conn:
+            cursor = conn.cursor()
+            table, stage, file_format = self._prepare_snowflake_stage(
+                conn, schema, table_name
+            )
+            self.client.upload_dir_to_stage(
+                chunk_dir, stage, pattern="part_*.parquet", workers=put_workers
+            )
+            return self._copy_stage_into_table(
+                cursor, table, stage, file_format, write_disposition
+            )
+
+    def _copy_batches_to_snowflake(
+        self,
+        batches: Iterable[pl.DataFrame],
+        schema: str,
+        table_name: str,
+        write_disposition: str = "append",
+        put_workers: int = 4,
+    ) -> int:
+        """
+        Bulk load a stream of DataFrames to Snowflake with pipelined PUTs and one COPY.
+
+        Each batch is written to its own Parquet file, with DLT's
+        _dlt_load_id/_dlt_id columns added, and uploaded by a pool of
+        `put_workers` threads while the next batch is being produced. At most
+        `put_workers` batches are in flight, so memory stays bounded by the
+        batch size rather than the total data.
+
+        Args:
+            batches: DataFrames to load, all with the same columns
+            schema: Target schema name
+            table_name: Target table name
+            write_disposition: "append" or "replace"
+            put_workers: Number of batches written and uploaded concurrently
+
+        Returns:
+            Number of rows loaded
+        """
+        with (
+            tempfile.TemporaryDirectory() as tmp_dir,
+            self.client.get_connection() as conn,
+        ):
+            cursor = conn.cursor()
+            table, stage, file_format = self._prepare_snowflake_stage(
+                conn, schema, table_name
+            )
+
+            load_id = _new_load_id()
+
+            def _write_and_put(batch: pl.DataFrame, chunk_path: Path) -> None:
+                batch = _with_dlt_columns(batch, load_id)
+                batch.rename(
+                    {name: _snowflake_identifier(name) for name in batch.columns}
+                ).write_parquet(chunk_path)
+                self.client.put_file(chunk_path, stage)
+                chunk_path.unlink()
+
+            in_flight, n_files = [], 0
+            with ThreadPoolExecutor(max_workers=put_workers) as executor:
+                for batch in batches:
+                    if len(in_flight) >= put_workers:
+                        in_flight.pop(0).result()
+                    chunk_path = Path(tmp_dir) / f"part_{n_files:05d}.parquet"
+                    in_flight.append(executor.submit(_write_and_put, batch, chunk_path))
+                    n_files += 1
+                for future in in_flight:
+                    future.result()
+
+            if n_files == 0:
+                return 0
+            return self._copy_stage_into_table(
+                cursor, table, stage, file_format, write_disposition
+            )
+
+    def _prepare_snowflake_stage(self, conn, schema: str, table_name: str) -> tuple:
+        """
+        Make sure the schema, temporary stage and Parquet file format exist.
+
+        The setup runs once per (session, stage); later loads on the same
+        session only clear leftovers of a previously failed load from the stage.
+
+        Returns:
+            (table, stage, file_format) qualified names
+        """
+        schema = schema.upper()
+        table = f"{schema}.{table_name.upper()}"
+        stage = f"{schema}.{table_name.upper()}_STAGE"
+        file_format = f"{schema}.PARQUET_FORMAT"
+
+        cursor = conn.cursor()
+        session_key = (conn.session_id, stage)
+        if session_key in self._snowflake_sessions_ready:
+            cursor.execute(f"REMOVE @{stage}")
+        else:
+            # Send all setup DDL in one multi-statement request (one round-trip)
+            cursor.execute(
+                f"""
+                CREATE SCHEMA IF NOT EXISTS {schema};
+                CREATE TEMPORARY STAGE IF NOT EXISTS {stage};
+                REMOVE @{stage};
+                CREATE TEMPORARY FILE FORMAT IF NOT EXISTS {file_format}
+                    TYPE = PARQUET
+                    USE_VECTORIZED_SCANNER = {str(self.client.vectorized_scanner).upper()};
+                """,
+                num_statements=4,
+            )
+            self._snowflake_sessions_ready.add(session_key)
+        return table, stage, file_format
+
+    def _copy_stage_into_table(
+        self, cursor, table: str, stage: str, file_format: str, write_disposition: str
+    ) -> int:
+        """Create the table from the staged files if needed and COPY them into it."""
+        create = (
+            "CREATE OR REPLACE TABLE"
+            if write_disposition == "replace"
+            else "CREATE TABLE IF NOT EXISTS"
+        )
+        cursor.execute(
+            f"""
+            {create} {table} USING TEMPLATE (
+                SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*)) WITHIN GROUP (ORDER BY ORDER_ID)
+                FROM TABLE(INFER_SCHEMA(
+                    LOCATION => '@{stage}', FILE_FORMAT => '{file_format}'
+                ))
+            )
+            """
+        )
+        cursor.execute(
+            f"""
+            COPY INTO {table} FROM @{stage}
+            FILE_FORMAT = (FORMAT_NAME = '{file_format}')
+            MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+            ON_ERROR = ABORT_STATEMENT
+            PURGE = TRUE
+            """
+        )
+        # COPY returns one row per file: (file, status, rows_parsed, rows_loaded, ...)
+        return sum(row[3] for row in cursor.fetchall())
+
     def load_dataframe(
         self,
         df: pl.DataFrame,
@@ -90,6 +441,10 @@ class Loader:
         """
         Load Polars DataFrame directly to the database using DLT.
 
+        For Snowflake, "append" and "replace" loads can bypass DLT and use a
+        bulk PUT + COPY INTO instead (see `_copy_dataframe_to_snowflake`); set
+        SNOWFLAKE_LOAD_WITH_COPY=1 to opt in.
+
         Args:
             df: Polars DataFrame to load
             schema: Target schema name
@@ -100,7 +455,7 @@ class Loader:
                         Example: ["contract_address", "chain"]
 
         Returns:
-            DLT pipeline run result
+            DLT pipeline run result, or the number of rows loaded by COPY INTO
         """
         # Validate merge requirements
         if write_disposition == "merge" and not primary_key:
@@ -109,28 +464,222 @@ class Loader:
                 "Example: primary_key=['contract_address', 'chain']"
             )
 
-        # Convert DataFrame to list of dicts for DLT
-        data = df.to_dicts()
+        if self._use_snowflake_copy(write_disposition):
+            return self._copy_dataframe_to_snowflake(
+                df, schema, table_name, write_disposition
+            )
+
+        # Hand DLT Arrow record batches (zero-copy from Polars) instead of row dicts
+        arrow_table = df.to_arrow()
+        data = arrow_table.to_batches(max_chunksize=ARROW_BATCH_SIZE)
 
         # Create a DLT resource from the data
-        resource = dlt.resource(data, name=table_name)
+        resource = dlt.resource(
+            self._dlt_items(data, arrow_table.schema), name=table_name
+        )
 
         # Apply primary key hint for merge operations
         if primary_key:
             resource.apply_hints(primary_key=primary_key)
 
         # Create pipeline with destination-specific configuration
-        pipeline = dlt.pipeline(
-            pipeline_name="dataframe_loader",
-            destination=self.client.get_dlt_destination(),
-            dataset_name=schema,
-        )
+        pipeline = self._dlt_pipeline("dataframe_loader", schema)
 
         # Load data
         result = pipeline.run(
             resource,
             table_name=table_name,
             write_disposition=write_disposition,
+            loader_file_format=self._loader_file_format(arrow_table.schema),
         )
 
         return result
+
+    def load_dataframe_batches(
+        self,
+        batches: Iterable[pl.DataFrame],
+        schema: str,
+        table_name: str,
+        write_disposition: str = "append",
+        primary_key: list[str] = None,
+    ):
+        """
+        Load a stream of Polars DataFrames without materializing them together.
+
+        Batches are consumed as they are produced, so a generator reading from
+        another database overlaps with the upload. The batches are handed to
+        DLT as Arrow data. With SNOWFLAKE_LOAD_WITH_COPY set, Snowflake
+        "append" and "replace" loads are instead staged batch by batch and
+        loaded with one COPY INTO (see `_copy_batches_to_snowflake`).
+
+        Args:
+            batches: DataFrames to load, all with the same columns
+            schema: Target schema name
+            table_name: Target table name
+            write_disposition: How to handle existing data ("append", "replace", "merge")
+            primary_key: List of column names to use as primary key for merge operations.
+                        Required when write_disposition="merge".
+
+        Returns:
+            DLT pipeline run result, or the number of rows loaded by COPY INTO
+        """
+        if write_disposition == "merge" and not primary_key:
+            raise ValueError(
+                "primary_key must be specified when write_disposition='merge'. "
+                "Example: primary_key=['contract_address', 'chain']"
+            )
+
+        if self._use_snowflake_copy(write_disposition):
+            return self._copy_batches_to_snowflake(
+                batches, schema, table_name, write_disposition
+            )
+
+        # The first batch decides the loader file format
+        arrow_batches = (batch.to_arrow() for batch in batches)
+        first = next(arrow_batches, None)
+        if first is None:
+            return None
+
+        resource = dlt.resource(
+            self._dlt_items(itertools.chain([first], arrow_batches), first.schema),
+            name=table_name,
+        )
+        if primary_key:
+            resource.apply_hints(primary_key=primary_key)
+
+        pipeline = self._dlt_pipeline("dataframe_loader", schema)
+        return pipeline.run(
+            resource,
+            table_name=table_name,
+            write_disposition=write_disposition,
+            loader_file_format=self._loader_file_format(first.schema),
+        )
+
+
+def _expand_parquet_paths(file_path: str) -> List[str]:
+    """Resolve a Parquet file path or glob pattern to the matching files."""
+    file_paths = sorted(glob.glob(file_path, recursive=True))
+    if not file_paths:
+        raise FileNotFoundError(f"No Parquet files match: {file_path}")
+    return file_paths
+
+
+def _new_load_id() -> str:
+    """Return a DLT-style load id (the load's Unix timestamp)."""
+    return f"{time.time():.6f}"
+
+
+def _with_dlt_columns(
+    frame, load_id: str, id_prefix: Optional[str] = None, offset: int = 0
+):
+    """
+    Add DLT's _dlt_load_id/_dlt_id columns to a DataFrame or LazyFrame.
+
+    Tables bulk loaded with COPY INTO then have the same columns as tables
+    created by DLT: appends to a DLT-created table, where both are NOT NULL,
+    succeed, and the dbt staging models can select them. Row ids are a prefix
+    (random per frame unless given) plus the row index counted from `offset`,
+    so frames sharing a prefix stay unique when their offsets do not overlap.
+    """
+    id_prefix = id_prefix or uuid.uuid4().hex[:12]
+    return (
+        frame.with_row_index("_dlt_row", offset=offset)
+        .with_columns(
+            pl.lit(load_id).alias("_dlt_load_id"),
+            pl.concat_str(
+                [pl.lit(id_prefix), pl.col("_dlt_row").cast(pl.String)]
+            ).alias("_dlt_id"),
+        )
+        .drop("_dlt_row")
+    )
+
+
+def _snowflake_identifier(name: str) -> str:
+    """Convert a camelCase column name to upper snake_case (blockNumber -> BLOCK_NUMBER)."""
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).upper()
+
+
+def _split_parquet(
+    file_path: str,
+    output_dir: Path,
+    load_id: str,
+    chunk_bytes: int = COPY_CHUNK_BYTES,
+) -> List[Path]:
+    """
+    Rewrite Parquet file(s) into chunks of roughly `chunk_bytes` for staging.
+
+    The files are read once, in record batches. Each batch gets DLT's columns
+    and upper snake_case names and is appended to the current chunk, which is
+    closed after `rows_per_chunk` rows. Row counts come from the footers.
+    """
+    file_paths = _expand_parquet_paths(file_path)
+    n_rows = sum(pq.ParquetFile(path).metadata.num_rows for path in file_paths)
+    total_bytes = sum(os.path.getsize(path) for path in file_paths)
+    n_chunks = max(1, math.ceil(total_bytes / chunk_bytes))
+    rows_per_chunk = max(1, math.ceil(n_rows / n_chunks))
+
+    id_prefix = uuid.uuid4().hex[:12]
+    row_offset = 0
+
+    def _to_staging(data) -> pa.Table:
+        nonlocal row_offset
+        df = _with_dlt_columns(pl.from_arrow(data), load_id, id_prefix, row_offset)
+        row_offset += len(df)
+        return df.rename(
+            {name: _snowflake_identifier(name) for name in df.columns}
+        ).to_arrow()
+
+    chunk_paths, writer, rows_in_chunk = [], None, 0
+    try:
+        for path in file_paths:
+            batches = pq.ParquetFile(path).iter_batches(batch_size=ARROW_BATCH_SIZE)
+            for batch in batches:
+                table = _to_staging(batch)
+                while table.num_rows:
+                    if writer is None:
+                        chunk_path = output_dir / f"part_{len(chunk_paths):05d}.parquet"
+                        writer = pq.ParquetWriter(
+                            chunk_path, table.schema, compression="zstd"
+                        )
+                        chunk_paths.append(chunk_path)
+                        rows_in_chunk = 0
+                    n_take = min(table.num_rows, rows_per_chunk - rows_in_chunk)
+                    writer.write_table(table.slice(0, n_take))
+                    table = table.slice(n_take)
+                    rows_in_chunk += n_take
+                    if rows_in_chunk >= rows_per_chunk:
+                        writer.close()
+                        writer = None
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if not chunk_paths:
+        # No rows: stage one empty chunk so the table can still be created
+        chunk_path = output_dir / "part_00000.parquet"
+        pq.write_table(
+            _to_staging(pq.read_schema(file_paths[0]).empty_table()), chunk_path
+        )
+        chunk_paths.append(chunk_path)
+    return chunk_paths
+
+
+def _split_dataframe(
+    df: pl.DataFrame,
+    output_dir: Path,
+    load_id: str,
+    rows_per_chunk: int = COPY_CHUNK_ROWS,
+) -> List[Path]:
+    """Write a DataFrame as Parquet chunks of `rows_per_chunk` rows for staging."""
+    df = _with_dlt_columns(df, load_id)
+    df = df.rename({name: _snowflake_identifier(name) for name in df.columns})
+    offsets = range(0, max(len(df), 1), rows_per_chunk)
+    chunk_paths = [output_dir / f"part_{i:05d}.parquet" for i in range(len(offsets))]
+
+    def _write_chunk(offset: int, chunk_path: Path) -> None:
+        df.slice(offset, rows_per_chunk).write_parquet(chunk_path)
+
+    # Parquet encoding releases the GIL, so chunks are written in parallel
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(_write_chunk, offsets, chunk_paths))
+    return chunk_paths
@@ -1,9 +1,9 @@
-from typing import Optional, Any, Dict
-import os
+from typing import Optional, Any, Dict, Iterator, Sequence
+import os, threading, uuid
 from contextlib import contextmanager
 
-import psycopg
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Engine
 import dlt
 
 from .base_client import BaseDatabaseClient
@@ -19,6 +19,9 @@ class PostgresClient(BaseDatabaseClient):
         database: str = None,
         user: str = None,
         password: str = None,
+        pool_size: int = 25,
+        pgbouncer: bool = False,
+        prepare_threshold: Optional[int] = 5,
     ):
         """
         Initialize PostgresDestination with database configuration.
@@ -29,23 +32,48 @@ class PostgresClient(BaseDatabaseClient):
             database: Database name
             user: Database user
             password: Database password
+            pool_size: Maximum number of pooled connections kept open
+            pgbouncer: Whether host/port point at PgBouncer in transaction pooling
+                       mode, which rules out session-level features such as
+                       server-side prepared statements
+            prepare_threshold: Executions of the same query on a connection after
+                               which psycopg prepares it server-side (psycopg's
+                               default of 5; 0 prepares immediately, None never).
+                               Lower it only for clients that rerun the same
+                               queries; ignored with pgbouncer
         """
         self.host = host
         self.port = port
         self.database = database
         self.user = user
         self.password = password
+        self.pool_size = pool_size
+        self.pgbouncer = pgbouncer
+        self.prepare_threshold = None if pgbouncer else prepare_threshold
+        self._urls: Dict[str, URL] = {}
+        self._engine_lock = threading.Lock()
         super().__init__()
 
     @classmethod
     def from_env(cls) -> "PostgresClient":
-        """Create from environment variables"""
+        """Create from environment variables
+
+        If PGBOUNCER_PORT is set (and not empty), connections go through
+        PgBouncer on that port instead of directly to POSTGRES_PORT.
+        """
+        pgbouncer_port = cls._get_env_var("PGBOUNCER_PORT")
+        if pgbouncer_port:
+            port = int(pgbouncer_port)
+        else:
+            port = int(cls._get_env_var("POSTGRES_PORT", "5432"))
         return cls(
             host=cls._get_env_var("POSTGRES_HOST"),
-            port=int(cls._get_env_var("POSTGRES_PORT", "5432")),
+            port=port,
             database=cls._get_env_var("POSTGRES_DB"),
             user=cls._get_env_var("POSTGRES_USER"),
             password=cls._get_env_var("POSTGRES_PASSWORD"),
+            pool_size=int(cls._get_env_var("POSTGRES_POOL_SIZE", "25")),
+            pgbouncer=bool(pgbouncer_port),
         )
 
     def _build_connection_params(self) -> Dict[str, Any]:
@@ -58,19 +86,89 @@ class PostgresClient(BaseDatabaseClient):
             "password": self.password,
         }
 
+    def get_connection_url(self, drivername: str = "postgresql") -> URL:
+        """Build a SQLAlchemy URL (credentials escaped) from the connection parameters.
+
+        URLs are immutable, so each one is built once per driver name and reused.
+        """
+        if drivername not in self._urls:
+            params = self.connection_params
+            self._urls[drivername] = URL.create(
+                drivername,
+                username=params["user"],
+                password=params["password"],
+                host=params["host"],
+                port=params["port"],
+                database=params["dbname"],
+            )
+        return self._urls[drivername]
+
+    def get_engine(self) -> Engine:
+        """Return the SQLAlchemy engine owning the connection pool, creating it lazily."""
+        if self._engine is not None:
+            return self._engine
+        # Threads sharing the client must not each build a pool of their own
+        with self._engine_lock:
+            if self._engine is None:
+                # Pooled connections outlive a single get_connection() call, so
+                # statements psycopg prepares stay cached for later checkouts.
+                # prepare_threshold is forced to None behind PgBouncer: transaction
+                # pooling hands each transaction to any backend, so statements
+                # prepared on one backend are unknown to the next.
+                self._engine = create_engine(
+                    self.get_connection_url("postgresql+psycopg"),
+                    pool_size=self.pool_size,
+                    max_overflow=0,
+                    pool_pre_ping=True,
+                    connect_args={"prepare_threshold": self.prepare_threshold},
+                )
+        return self._engine
+
     @contextmanager
     def get_connection(self):
-        """Context manager for PostgreSQL connections."""
-        conn = None
+        """Context manager for pooled PostgreSQL connections.
+
+        Yields the underlying psycopg connection; it is returned to the pool
+        (and any open transaction rolled back) on exit instead of being closed.
+        """
+        pooled = self.get_engine().raw_connection()
         try:
-            conn = psycopg.connect(**self.connection_params)
-            yield conn
+            yield pooled.dbapi_connection
         finally:
-            if conn:
-                conn.close()
+            pooled.close()
+
+    def iter_rows(
+        self,
+        query: str,
+        params: Optional[Sequence[Any]] = None,
+        itersize: int = 10_000,
+        binary: bool = True,
+    ) -> Iterator[tuple]:
+        """Stream the rows of a query through a server-side cursor.
+
+        Rows are fetched `itersize` at a time, so memory stays bounded however
+        large the result is. Use this instead of fetchall() for logs and
+        transactions sized queries.
+
+        Args:
+            query: SQL query, with %s placeholders for `params`
+            params: Query parameters
+            itersize: Rows fetched per round-trip
+            binary: Fetch rows in Postgres' binary format, so numbers and
+                    timestamps are not rendered to text and re-parsed
+
+        Yields:
+            Result rows as tuples
+        """
+        with self.get_connection() as conn:
+            with conn.cursor(
+                name=f"iter_rows_{uuid.uuid4().hex[:8]}", binary=binary
+            ) as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query, params)
+                yield from cursor
 
     def get_dlt_destination(self) -> Any:
         """Return DLT destination for pipeline operations."""
-        params = self.connection_params
-        connection_url = f"postgresql://{params['user']}:{params['password']}@{params['host']}:{params['port']}/{params['dbname']}"
+        connection_url = self.get_connection_url().render_as_string(hide_password=False)
         return dlt.destinations.postgres(connection_url)
@@ -1,14 +1,28 @@
 import snowflake.connector
+import atexit
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
 import dlt
 
 from .base_client import BaseDatabaseClient
 
 
 class SnowflakeClient(BaseDatabaseClient):
-    """Reusable Snowflake client with connection management."""
+    """Reusable Snowflake client with connection management.
+
+    Result chunks are downloaded by `prefetch_threads` parallel threads in Arrow
+    format. Callers reading large result sets should use the cursor's
+    `fetch_arrow_batches()` / `fetch_arrow_all()` (or `pl.from_arrow` on them)
+    rather than `fetchall()`, which converts every row to Python objects.
+    """
+
+    # Authenticated connections shared across the process, keyed by connection params
+    _connections: Dict[tuple, Any] = {}
+    _connections_lock = threading.Lock()
 
     def __init__(
         self,
@@ -19,8 +33,16 @@ class SnowflakeClient(BaseDatabaseClient):
         warehouse: str = None,
         database: str = None,
         role: str = None,
+        vectorized_scanner: bool = True,
+        prefetch_threads: int = 8,
     ):
-        """Initialize Snowflake client with environment configuration."""
+        """Initialize Snowflake client with environment configuration.
+
+        Args:
+            vectorized_scanner: Use Snowflake's vectorized Parquet scanner
+                                (USE_VECTORIZED_SCANNER) for COPY INTO loads
+            prefetch_threads: Threads used to download result chunks in parallel
+        """
         self.account = account
         self.user = user
         self.authenticator = authenticator
@@ -28,6 +50,8 @@ class SnowflakeClient(BaseDatabaseClient):
         self.warehouse = warehouse
         self.database = database
         self.role = role
+        self.vectorized_scanner = vectorized_scanner
+        self.prefetch_threads = prefetch_threads
         super().__init__()
 
     @classmethod
@@ -59,14 +83,86 @@ class SnowflakeClient(BaseDatabaseClient):
 
     @contextmanager
     def get_connection(self):
-        """Context manager for Snowflake connections."""
-        conn = None
-        try:
-            conn = snowflake.connector.connect(**self.connection_params)
-            yield conn
-        finally:
-            if conn:
+        """Context manager for the process-wide Snowflake connection.
+
+        The first call authenticates and opens a keep-alive session; later calls
+        with the same parameters reuse it instead of paying the handshake again.
+        Callers must not close it; it is closed at interpreter exit.
+        """
+        key = tuple(sorted(self.connection_params.items()))
+        with self._connections_lock:
+            conn = self._connections.get(key)
+            if conn is None or conn.is_closed():
+                conn = snowflake.connector.connect(
+                    **self.connection_params,
+                    client_session_keep_alive=True,
+                    client_prefetch_threads=self.prefetch_threads,
+                )
+                self._connections[key] = conn
+        yield conn
+
+    def put_file(
+        self,
+        path: Union[str, Path],
+        stage: str,
+        auto_compress: bool = False,
+    ) -> None:
+        """Upload one local file to a stage with PUT, on its own cursor.
+
+        Args:
+            path: File to upload
+            stage: Target stage name, without the leading '@'
+            auto_compress: Gzip the file before upload (leave off for Parquet)
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"PUT 'file://{Path(path).resolve().as_posix()}' @{stage} "
+                    f"PARALLEL = 4 AUTO_COMPRESS = {str(auto_compress).upper()} "
+                    "OVERWRITE = TRUE"
+                )
+
+    def upload_dir_to_stage(
+        self,
+        local_dir: Union[str, Path],
+        stage: str,
+        pattern: str = "*",
+        workers: int = 8,
+        auto_compress: bool = False,
+    ) -> List[str]:
+        """Upload every file in a directory to a stage with concurrent PUTs.
+
+        A single PUT is bound by per-file encryption and TLS, so each worker
+        uploads one file on its own cursor of the shared connection.
+
+        Args:
+            local_dir: Directory containing the files to upload
+            stage: Target stage name, without the leading '@'
+            pattern: Glob pattern selecting the files in `local_dir`
+            workers: Number of concurrent PUT uploads
+            auto_compress: Gzip files before upload (leave off for Parquet)
+
+        Returns:
+            Sorted list of uploaded file paths
+        """
+        paths = sorted(p for p in Path(local_dir).glob(pattern) if p.is_file())
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(
+                executor.map(
+                    lambda path: self.put_file(path, stage, auto_compress), paths
+                )
+            )
+
+        return [p.as_posix() for p in paths]
+
+    @classmethod
+    def close_connections(cls):
+        """Close all cached Snowflake connections."""
+        with cls._connections_lock:
+            for conn in cls._connections.values():
                 conn.close()
+            cls._connections.clear()
 
     def get_dlt_destination(self):
         """Get DLT destination configuration for Snowflake."""
@@ -95,3 +191,6 @@ class SnowflakeClient(BaseDatabaseClient):
             ]
 
         return dlt.destinations.snowflake(credentials=credentials)
+
+
+atexit.register(SnowflakeClient.close_connections)
@@ -0,0 +1,61 @@
+"""Tests for the block chunking of etherscan_to_parquet."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from onchaindata.data_extraction import etherscan
+
+
+@pytest.fixture
+def requested_ranges(monkeypatch):
+    """Record the (from_block, to_block) of every request instead of calling the API."""
+    ranges = []
+
+    class FakeExtractor:
+        def __init__(self, client):
+            pass
+
+        def to_parquet(self, from_block, to_block, **kwargs):
+            ranges.append((from_block, to_block))
+
+    monkeypatch.setattr(etherscan, "EtherscanExtractor", FakeExtractor)
+    return ranges
+
+
+def _run(from_block: int, to_block: int, block_chunk_size: int) -> None:
+    etherscan.etherscan_to_parquet(
+        address="0xABC",
+        etherscan_client=SimpleNamespace(chain="ethereum"),
+        from_block=from_block,
+        to_block=to_block,
+        output_path=Path("unused.parquet"),
+        table="logs",
+        block_chunk_size=block_chunk_size,
+    )
+
+
+def test_single_block(requested_ranges):
+    _run(5, 5, 5_000)
+    assert requested_ranges == [(5, 5)]
+
+
+def test_range_shorter_than_one_chunk(requested_ranges):
+    _run(100, 3_000, 5_000)
+    assert requested_ranges == [(100, 3_000)]
+
+
+def test_chunks_with_short_tail(requested_ranges):
+    _run(0, 12_000, 5_000)
+    assert requested_ranges == [(0, 5_000), (5_000, 10_000), (10_000, 12_000)]
+
+
+def test_whole_chunks(requested_ranges):
+    _run(0, 10_000, 5_000)
+    assert requested_ranges == [(0, 5_000), (5_000, 10_000)]
+
+
+def test_reversed_range(requested_ranges):
+    with pytest.raises(AssertionError):
+        _run(10, 5, 5_000)
@@ -0,0 +1,89 @@
+"""Tests for the pure helpers of scripts/el/extract_etherscan.py."""
+
+import importlib.util
+from pathlib import Path
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+SCRIPT_PATH = Path(__file__).parents[1] / "scripts" / "el" / "extract_etherscan.py"
+spec = importlib.util.spec_from_file_location("extract_etherscan", SCRIPT_PATH)
+extract_etherscan = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(extract_etherscan)
+
+split_block_range = extract_etherscan.split_block_range
+parquet_block_stats = extract_etherscan.parquet_block_stats
+
+
+class TestSplitBlockRange:
+    def test_even_split(self):
+        assert split_block_range(0, 20_000, 4, 5_000) == [
+            (0, 10_000),
+            (10_000, 20_000),
+        ]
+
+    def test_short_tail_is_folded(self):
+        # 7 chunks in windows of 3: the 2k-block tail joins the previous window
+        assert split_block_range(0, 32_000, 3, 5_000) == [
+            (0, 15_000),
+            (15_000, 32_000),
+        ]
+
+    def test_range_within_one_chunk(self):
+        assert split_block_range(100, 3_000, 4, 5_000) == [(100, 3_000)]
+
+    def test_single_block(self):
+        assert split_block_range(5, 5, 4, 5_000) == [(5, 5)]
+
+    def test_reversed_range(self):
+        with pytest.raises(ValueError, match="from_block"):
+            split_block_range(10, 5, 4, 5_000)
+
+    @pytest.mark.parametrize(
+        "from_block, to_block, n_windows, chunk",
+        [(0, 1_000_000, 8, 5_000), (123, 98_765, 4, 1_000), (7, 70_007, 3, 10_000)],
+    )
+    def test_windows_cover_range(self, from_block, to_block, n_windows, chunk):
+        windows = split_block_range(from_block, to_block, n_windows, chunk)
+
+        assert 1 <= len(windows) <= n_windows
+        assert windows[0][0] == from_block
+        assert windows[-1][1] == to_block
+        # Contiguous, sharing boundary blocks
+        for (_, end), (start, _) in zip(windows, windows[1:]):
+            assert end == start
+        # Every window but the last is a whole number of chunks
+        for start, end in windows[:-1]:
+            assert (end - start) % chunk == 0
+
+
+class TestParquetBlockStats:
+    def _write(self, path: Path, write_statistics: bool) -> None:
+        table = pa.table({"blockNumber": [30, 10, 20, 50, 40], "x": list("abcde")})
+        pq.write_table(table, path, row_group_size=2, write_statistics=write_statistics)
+
+    def test_reads_footer_statistics(self, tmp_path):
+        path = tmp_path / "with_stats.parquet"
+        self._write(path, write_statistics=True)
+
+        assert pq.ParquetFile(path).metadata.num_row_groups == 3
+        assert parquet_block_stats(path) == (5, 10, 50)
+
+    def test_falls_back_to_scan_without_statistics(self, tmp_path):
+        path = tmp_path / "without_stats.parquet"
+        self._write(path, write_statistics=False)
+
+        assert parquet_block_stats(path) == (5, 10, 50)
+
+    def test_matches_polars_scan(self, tmp_path):
+        path = tmp_path / "scan.parquet"
+        self._write(path, write_statistics=True)
+
+        expected = pl.read_parquet(path).select(
+            pl.len(),
+            pl.col("blockNumber").min().alias("min_block"),
+            pl.col("blockNumber").max().alias("max_block"),
+        )
+        assert parquet_block_stats(path) == expected.row(0)
@@ -0,0 +1,148 @@
+"""Tests for the pure helpers of onchaindata.data_pipeline.loaders."""
+
+import math
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from onchaindata.data_pipeline.loaders import (
+    Loader,
+    _expand_parquet_paths,
+    _snowflake_identifier,
+    _split_parquet,
+    _with_dlt_columns,
+)
+from onchaindata.utils import PostgresClient, SnowflakeClient
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("blockNumber", "BLOCK_NUMBER"),
+        ("transactionHash", "TRANSACTION_HASH"),
+        ("contract_address", "CONTRACT_ADDRESS"),
+        ("_dlt_load_id", "_DLT_LOAD_ID"),
+        ("topic0", "TOPIC0"),
+        ("erc20Token", "ERC20_TOKEN"),
+        ("blockHASH", "BLOCK_HASH"),
+        ("ID", "ID"),
+    ],
+)
+def test_snowflake_identifier(name, expected):
+    assert _snowflake_identifier(name) == expected
+
+
+def test_expand_parquet_paths(tmp_path):
+    for name in ("b.parquet", "a.parquet", "c.csv"):
+        (tmp_path / name).touch()
+
+    assert _expand_parquet_paths(str(tmp_path / "*.parquet")) == [
+        str(tmp_path / "a.parquet"),
+        str(tmp_path / "b.parquet"),
+    ]
+    assert _expand_parquet_paths(str(tmp_path / "a.parquet")) == [
+        str(tmp_path / "a.parquet")
+    ]
+    with pytest.raises(FileNotFoundError):
+        _expand_parquet_paths(str(tmp_path / "missing_*.parquet"))
+
+
+def test_with_dlt_columns():
+    df = _with_dlt_columns(pl.DataFrame({"x": [1, 2, 3]}), "1700000000.000000")
+
+    assert df.columns == ["x", "_dlt_load_id", "_dlt_id"]
+    assert df["_dlt_load_id"].to_list() == ["1700000000.000000"] * 3
+    assert df["_dlt_id"].null_count() == 0
+    assert df["_dlt_id"].n_unique() == 3
+
+    # Each frame gets its own id prefix, so batches of one load do not collide
+    other = _with_dlt_columns(pl.DataFrame({"x": [1, 2, 3]}), "1700000000.000000")
+    assert set(df["_dlt_id"]).isdisjoint(other["_dlt_id"])
+
+
+def _postgres_loader() -> Loader:
+    # Building the client does not connect
+    return Loader(PostgresClient(host="localhost", port=5432, database="db"))
+
+
+def test_postgres_nested_columns_load_from_row_dicts():
+    # Etherscan logs: `topics` is a list column, which DLT's CSV writer rejects
+    table = pa.table(
+        {
+            "blockNumber": [1, 2],
+            "topics": pa.array(
+                [["0xddf2", "0x0001"], ["0xddf2"]],
+                type=pa.large_list(pa.large_string()),
+            ),
+        }
+    )
+    loader = _postgres_loader()
+
+    assert loader._loader_file_format(table.schema) == "insert_values"
+    assert list(loader._dlt_items(table.to_batches(), table.schema)) == [
+        {"blockNumber": 1, "topics": ["0xddf2", "0x0001"]},
+        {"blockNumber": 2, "topics": ["0xddf2"]},
+    ]
+
+
+def test_postgres_flat_columns_stay_arrow():
+    table = pa.table({"blockNumber": [1, 2], "hash": ["0xa", "0xb"]})
+    loader = _postgres_loader()
+    batches = table.to_batches()
+
+    assert loader._loader_file_format(table.schema) == "csv"
+    assert loader._dlt_items(batches, table.schema) is batches
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, False),
+        ("", False),
+        ("0", False),
+        ("false", False),
+        ("no", False),
+        ("1", True),
+        ("true", True),
+        ("TRUE", True),
+        ("yes", True),
+    ],
+)
+def test_use_snowflake_copy_flag(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("SNOWFLAKE_LOAD_WITH_COPY", raising=False)
+    else:
+        monkeypatch.setenv("SNOWFLAKE_LOAD_WITH_COPY", value)
+    loader = Loader(SnowflakeClient(account="acct", user="user"))
+
+    assert loader._use_snowflake_copy("append") is expected
+    assert loader._use_snowflake_copy("merge") is False
+
+
+def test_split_parquet_single_pass(tmp_path):
+    for i in range(2):
+        pq.write_table(
+            pa.table({"blockNumber": list(range(i * 5, i * 5 + 5))}),
+            tmp_path / f"logs_{i}.parquet",
+        )
+    total_bytes = sum(p.stat().st_size for p in tmp_path.glob("logs_*.parquet"))
+    output_dir = tmp_path / "chunks"
+    output_dir.mkdir()
+
+    chunk_paths = _split_parquet(
+        str(tmp_path / "logs_*.parquet"),
+        output_dir,
+        "1700000000.000000",
+        chunk_bytes=math.ceil(total_bytes / 3),
+    )
+    chunks = [pl.read_parquet(path) for path in chunk_paths]
+    staged = pl.concat(chunks)
+
+    # Chunks cut across the input files' batches, without losing or reordering rows
+    assert len(chunks) > 1
+    assert staged.columns == ["BLOCK_NUMBER", "_DLT_LOAD_ID", "_DLT_ID"]
+    assert staged["BLOCK_NUMBER"].to_list() == list(range(10))
+    assert staged["_DLT_ID"].n_unique() == 10
+    assert staged["_DLT_LOAD_ID"].unique().to_list() == ["1700000000.000000"]